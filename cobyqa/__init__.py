@@ -1,4 +1,4 @@
-from .main import minimize
+from .main import minimize, minimize_batch
 from .utils import show_versions
 
 # PEP0440 compatible formatted version, see:
@@ -17,4 +17,4 @@ from .utils import show_versions
 # 'X.Y.dev0' is the canonical version of 'X.Y.dev'.
 __version__ = "1.1.1"
 
-__all__ = ["minimize", "show_versions"]
+__all__ = ["minimize", "minimize_batch", "show_versions"]
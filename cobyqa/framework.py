@@ -60,6 +60,8 @@ class TrustRegion:
 
         # Set the index of the best interpolation point.
         self._best_index = 0
+        self._merit_best = None
+        self._maxcv_best = None
         self.set_best_index()
 
         # Set the initial Lagrange multipliers.
@@ -275,6 +277,49 @@ class TrustRegion:
         """
         return self.models.ceq_val[self.best_index, :]
 
+    @property
+    def merit_best(self):
+        """
+        Value of the merit function at `x_best`.
+
+        The value is cached when the best point is set, and is recomputed only
+        if the cache has been invalidated.
+
+        Returns
+        -------
+        float
+            Value of the merit function at `x_best`.
+        """
+        if self._merit_best is None:
+            self._merit_best = self.merit(
+                self.x_best,
+                self.fun_best,
+                self.cub_best,
+                self.ceq_best,
+            )
+        return self._merit_best
+
+    @property
+    def maxcv_best(self):
+        """
+        Maximum constraint violation at `x_best`.
+
+        The value is cached when the best point is set, and is recomputed only
+        if the cache has been invalidated.
+
+        Returns
+        -------
+        float
+            Maximum constraint violation at `x_best`.
+        """
+        if self._maxcv_best is None:
+            self._maxcv_best = self._pb.maxcv(
+                self.x_best,
+                self.cub_best,
+                self.ceq_best,
+            )
+        return self._maxcv_best
+
     def lag_model(self, x):
         """
         Evaluate the Lagrangian model at a given point.
@@ -495,25 +540,25 @@ class TrustRegion:
         `numpy.ndarray`, shape (m_linear_eq + m_nonlinear_eq,)
             Right-hand side vector of the linearized equality constraints.
         """
-        aub = np.block(
+        aub = np.vstack(
             [
-                [self._pb.linear.a_ub],
-                [self.models.cub_grad(x)],
+                self._pb.linear.a_ub,
+                self.models.cub_grad(x),
             ]
         )
-        bub = np.block(
+        bub = np.concatenate(
             [
                 self._pb.linear.b_ub - self._pb.linear.a_ub @ x,
                 -self.models.cub(x),
             ]
         )
-        aeq = np.block(
+        aeq = np.vstack(
             [
-                [self._pb.linear.a_eq],
-                [self.models.ceq_grad(x)],
+                self._pb.linear.a_eq,
+                self.models.ceq_grad(x),
             ]
         )
-        beq = np.block(
+        beq = np.concatenate(
             [
                 self._pb.linear.b_eq - self._pb.linear.a_eq @ x,
                 -self.models.ceq(x),
@@ -674,7 +719,8 @@ class TrustRegion:
             ), "The index `k_new` must be different from the best index."
 
         # Build the k_new-th Lagrange polynomial.
-        coord_vec = np.squeeze(np.eye(1, self.models.npt, k_new))
+        coord_vec = np.zeros(self.models.npt)
+        coord_vec[k_new] = 1.0
         lag = Quadratic(
             self.models.interpolation,
             coord_vec,
@@ -858,12 +904,7 @@ class TrustRegion:
         float
             Reduction ratio.
         """
-        merit_old = self.merit(
-            self.x_best,
-            self.fun_best,
-            self.cub_best,
-            self.ceq_best,
-        )
+        merit_old = self.merit_best
         merit_new = self.merit(self.x_best + step, fun_val, cub_val, ceq_val)
         merit_model_old = self.merit(
             self.x_best,
@@ -898,7 +939,7 @@ class TrustRegion:
         aub, bub, aeq, beq = self.get_constraint_linearizations(self.x_best)
         viol_diff = max(
             np.linalg.norm(
-                np.block(
+                np.concatenate(
                     [
                         np.maximum(0.0, -bub),
                         beq,
@@ -906,7 +947,7 @@ class TrustRegion:
                 )
             )
             - np.linalg.norm(
-                np.block(
+                np.concatenate(
                     [
                         np.maximum(0.0, aub @ step - bub),
                         aeq @ step - beq,
@@ -918,7 +959,7 @@ class TrustRegion:
         sqp_val = self.sqp_fun(step)
 
         threshold = np.linalg.norm(
-            np.block(
+            np.concatenate(
                 [
                     self._lm_linear_ub,
                     self._lm_linear_eq,
@@ -953,17 +994,27 @@ class TrustRegion:
         """
         Set the index of the best point.
         """
-        best_index = self.best_index
-        m_best = self.merit(
-            self.x_best,
-            self.models.fun_val[best_index],
-            self.models.cub_val[best_index, :],
-            self.models.ceq_val[best_index, :],
+        # Bind the attributes used in the loop below to local variables.
+        interpolation = self.models.interpolation
+        fun_val = self.models.fun_val
+        cub_val = self.models.cub_val
+        ceq_val = self.models.ceq_val
+        merit = self.merit
+        maxcv = self._pb.maxcv
+
+        old_best_index = self.best_index
+        best_index = old_best_index
+        x_best = interpolation.point(best_index)
+        m_best = merit(
+            x_best,
+            fun_val[best_index],
+            cub_val[best_index, :],
+            ceq_val[best_index, :],
         )
-        r_best = self._pb.maxcv(
-            self.x_best,
-            self.models.cub_val[best_index, :],
-            self.models.ceq_val[best_index, :],
+        r_best = maxcv(
+            x_best,
+            cub_val[best_index, :],
+            ceq_val[best_index, :],
         )
         tol = (
             10.0
@@ -972,24 +1023,26 @@ class TrustRegion:
             * max(abs(m_best), 1.0)
         )
         for k in range(self.models.npt):
-            if k != self.best_index:
-                x_val = self.models.interpolation.point(k)
-                m_val = self.merit(
+            if k != old_best_index:
+                x_val = interpolation.point(k)
+                m_val = merit(
                     x_val,
-                    self.models.fun_val[k],
-                    self.models.cub_val[k, :],
-                    self.models.ceq_val[k, :],
+                    fun_val[k],
+                    cub_val[k, :],
+                    ceq_val[k, :],
                 )
-                r_val = self._pb.maxcv(
+                r_val = maxcv(
                     x_val,
-                    self.models.cub_val[k, :],
-                    self.models.ceq_val[k, :],
+                    cub_val[k, :],
+                    ceq_val[k, :],
                 )
                 if m_val < m_best or (m_val < m_best + tol and r_val < r_best):
                     best_index = k
                     m_best = m_val
                     r_best = r_val
         self._best_index = best_index
+        self._merit_best = m_best
+        self._maxcv_best = r_best
 
     def get_index_to_remove(self, x_new=None):
         """
@@ -1122,6 +1175,11 @@ class TrustRegion:
         """
         self.models.shift_x_base(np.copy(self.x_best), options)
 
+        # The best point is recomputed from the new base point, which may
+        # introduce rounding errors in the cached values.
+        self._merit_best = None
+        self._maxcv_best = None
+
     def set_multipliers(self, x):
         """
         Set the Lagrange multipliers.
@@ -1,3 +1,6 @@
+import functools
+import math
+import threading
 import warnings
 
 import numpy as np
@@ -33,6 +36,36 @@ from .settings import (
 )
 
 
+# Names of the options and constants accepted by the solver.
+_OPTIONS_NAMES = frozenset(option.value for option in Options)
+_CONSTANTS_NAMES = frozenset(constant.value for constant in Constants)
+
+# Exit statuses for which the returned point is known to be feasible.
+_FEASIBLE_STATUSES = frozenset(
+    [ExitStatus.TARGET_SUCCESS, ExitStatus.FEASIBLE_SUCCESS]
+)
+
+# Messages describing the exit statuses of the solver.
+_STATUS_MESSAGES = {
+    ExitStatus.RADIUS_SUCCESS: "The lower bound for the trust-region radius "
+                               "has been reached",
+    ExitStatus.TARGET_SUCCESS: "The target objective function value has been "
+                               "reached",
+    ExitStatus.FIXED_SUCCESS: "All variables are fixed by the bound "
+                              "constraints",
+    ExitStatus.CALLBACK_SUCCESS: "The callback requested to stop the "
+                                 "optimization procedure",
+    ExitStatus.FEASIBLE_SUCCESS: "The feasibility problem received has been "
+                                 "solved successfully",
+    ExitStatus.MAX_EVAL_WARNING: "The maximum number of function evaluations "
+                                 "has been exceeded",
+    ExitStatus.MAX_ITER_WARNING: "The maximum number of iterations has been "
+                                 "exceeded",
+    ExitStatus.INFEASIBLE_ERROR: "The bound constraints are infeasible",
+    ExitStatus.LINALG_ERROR: "A linear algebra error occurred",
+}
+
+
 def minimize(
     fun,
     x0,
@@ -440,7 +473,7 @@ def minimize(
     # Initialize the objective function.
     if not isinstance(args, tuple):
         args = (args,)
-    obj = ObjectiveFunction(fun, verbose, debug, *args)
+    obj = ObjectiveFunction(fun, verbose, debug, args)
 
     # Initialize the bound constraints.
     if not hasattr(x0, "__len__"):
@@ -557,6 +590,27 @@ def minimize(
             options,
         )
 
+    # Get the options that are needed in the main loop. The trust-region
+    # radii must be read after the initialization of the framework, as they
+    # may have been modified by the construction of the interpolation set.
+    max_eval = options[Options.MAX_EVAL]
+    max_iter = options[Options.MAX_ITER]
+    radius_final = options[Options.RHOEND]
+    target = options[Options.TARGET]
+
+    # Get the constants that are needed in the main loop.
+    large_shift_factor = constants[Constants.LARGE_SHIFT_FACTOR]
+    short_step_threshold = constants[Constants.SHORT_STEP_THRESHOLD]
+    decrease_resolution_factor = constants[
+        Constants.DECREASE_RESOLUTION_FACTOR
+    ]
+    resolution_factor = constants[Constants.RESOLUTION_FACTOR]
+    byrd_omojokun_factor_sq = constants[Constants.BYRD_OMOJOKUN_FACTOR] ** 2.0
+
+    # The numbers of nonlinear constraints are known once the initial
+    # interpolation set has been evaluated, so the problem type is fixed.
+    is_nonlinearly_constrained = pb.type == "nonlinearly constrained"
+
     # Start the optimization procedure.
     success = False
     n_iter = 0
@@ -564,29 +618,42 @@ def minimize(
     n_short_steps = 0
     n_very_short_steps = 0
     n_alt_models = 0
+
+    # The trust-region trial steps are assembled in a buffer allocated once.
+    # It is never stored by the framework nor the problem, since the evaluated
+    # points are always built as new arrays from the step.
+    step_buffer = np.empty(pb.n)
+
+    # The models and the interpolation set are updated in place, so that they
+    # can be bound once for the whole optimization procedure.
+    models = framework.models
+    interpolation = models.interpolation
     while True:
         # Stop the optimization procedure if the maximum number of iterations
         # has been exceeded. We do not write the main loop as a for loop
         # because we want to access the number of iterations outside the loop.
-        if n_iter >= options[Options.MAX_ITER]:
+        if n_iter >= max_iter:
             status = ExitStatus.MAX_ITER_WARNING
             break
         n_iter += 1
 
+        # The resolution and the trust-region radius are only modified by the
+        # framework when updating the radius or enhancing the resolution, so
+        # they are read once at the beginning of each iteration.
+        resolution = framework.resolution
+        radius_save = framework.radius
+
         # Update the point around which the quadratic models are built.
         if (
-            np.linalg.norm(
-                framework.x_best - framework.models.interpolation.x_base
-            )
-            >= constants[Constants.LARGE_SHIFT_FACTOR] * framework.radius
+            _norm_sq(framework.x_best - interpolation.x_base)
+            >= (large_shift_factor * radius_save) ** 2.0
         ):
             framework.shift_x_base(options)
 
         # Evaluate the trial step.
-        radius_save = framework.radius
         normal_step, tangential_step = framework.get_trust_region_step(options)
-        step = normal_step + tangential_step
-        s_norm = np.linalg.norm(step)
+        step = np.add(normal_step, tangential_step, out=step_buffer)
+        s_norm = _norm(step)
 
         # If the trial step is too short, we do not attempt to evaluate the
         # objective and constraint functions. Instead, we reduce the
@@ -594,23 +661,20 @@ def minimize(
         # enhanced and whether the geometry of the interpolation set should be
         # improved. Otherwise, we entertain a classical iteration. The
         # criterion for performing an exceptional jump is taken from NEWUOA.
-        if (
-            s_norm
-            <= constants[Constants.SHORT_STEP_THRESHOLD] * framework.resolution
-        ):
-            framework.radius *= constants[Constants.DECREASE_RESOLUTION_FACTOR]
-            if radius_save > framework.resolution:
-                n_short_steps = 0
-                n_very_short_steps = 0
-            else:
-                n_short_steps += 1
-                n_very_short_steps += 1
-                if s_norm > 0.1 * framework.resolution:
-                    n_very_short_steps = 0
-            enhance_resolution = n_short_steps >= 5 or n_very_short_steps >= 3
+        if s_norm <= short_step_threshold * resolution:
+            framework.radius *= decrease_resolution_factor
+            (
+                n_short_steps,
+                n_very_short_steps,
+                enhance_resolution,
+            ) = _update_short_steps(
+                s_norm,
+                resolution,
+                radius_save,
+                n_short_steps,
+                n_very_short_steps,
+            )
             if enhance_resolution:
-                n_short_steps = 0
-                n_very_short_steps = 0
                 improve_geometry = False
             else:
                 try:
@@ -620,20 +684,25 @@ def minimize(
                     break
                 improve_geometry = dist_new > max(
                     framework.radius,
-                    constants[Constants.RESOLUTION_FACTOR]
-                    * framework.resolution,
+                    resolution_factor * resolution,
                 )
         else:
             # Increase the penalty parameter if necessary.
             same_best_point = framework.increase_penalty(step)
             if same_best_point:
+                # The best point does not change until the interpolation set
+                # is updated below.
+                x_best = framework.x_best
+
                 # Evaluate the objective and constraint functions.
                 try:
                     fun_val, cub_val, ceq_val = _eval(
                         pb,
                         framework,
                         step,
-                        options,
+                        max_eval,
+                        target,
+                        feasibility_tol,
                     )
                 except TargetSuccess:
                     status = ExitStatus.TARGET_SUCCESS
@@ -652,26 +721,20 @@ def minimize(
                     break
 
                 # Perform a second-order correction step if necessary.
-                merit_old = framework.merit(
-                    framework.x_best,
-                    framework.fun_best,
-                    framework.cub_best,
-                    framework.ceq_best,
-                )
+                merit_old = framework.merit_best
                 merit_new = framework.merit(
-                    framework.x_best + step, fun_val, cub_val, ceq_val
+                    x_best + step, fun_val, cub_val, ceq_val
                 )
                 if (
-                    pb.type == "nonlinearly constrained"
+                    is_nonlinearly_constrained
                     and merit_new > merit_old
-                    and np.linalg.norm(normal_step)
-                    > constants[Constants.BYRD_OMOJOKUN_FACTOR] ** 2.0
-                    * framework.radius
+                    and _norm_sq(normal_step)
+                    > (byrd_omojokun_factor_sq * radius_save) ** 2.0
                 ):
                     soc_step = framework.get_second_order_correction_step(
                         step, options
                     )
-                    if np.linalg.norm(soc_step) > 0.0:
+                    if _norm_sq(soc_step) > 0.0:
                         step += soc_step
 
                         # Evaluate the objective and constraint functions.
@@ -680,7 +743,9 @@ def minimize(
                                 pb,
                                 framework,
                                 step,
-                                options,
+                                max_eval,
+                                target,
+                                feasibility_tol,
                             )
                         except TargetSuccess:
                             status = ExitStatus.TARGET_SUCCESS
@@ -698,87 +763,27 @@ def minimize(
                             status = ExitStatus.MAX_EVAL_WARNING
                             break
 
-                # Calculate the reduction ratio.
-                ratio = framework.get_reduction_ratio(
-                    step,
-                    fun_val,
-                    cub_val,
-                    ceq_val,
-                )
-
-                # Choose an interpolation point to remove.
+                # Update the framework with the evaluated trial point.
                 try:
-                    k_new = framework.get_index_to_remove(
-                        framework.x_best + step
-                    )[0]
-                except np.linalg.LinAlgError:
-                    status = ExitStatus.LINALG_ERROR
-                    break
-
-                # Update the interpolation set.
-                try:
-                    ill_conditioned = framework.models.update_interpolation(
-                        k_new, framework.x_best + step, fun_val, cub_val,
-                        ceq_val
+                    (
+                        k_new,
+                        n_alt_models,
+                        enhance_resolution,
+                        improve_geometry,
+                    ) = _classical_iteration(
+                        framework,
+                        x_best,
+                        step,
+                        fun_val,
+                        cub_val,
+                        ceq_val,
+                        radius_save,
+                        n_alt_models,
+                        constants,
                     )
                 except np.linalg.LinAlgError:
                     status = ExitStatus.LINALG_ERROR
                     break
-                framework.set_best_index()
-
-                # Update the trust-region radius.
-                framework.update_radius(step, ratio)
-
-                # Attempt to replace the models by the alternative ones.
-                if framework.radius <= framework.resolution:
-                    if ratio >= constants[Constants.VERY_LOW_RATIO]:
-                        n_alt_models = 0
-                    else:
-                        n_alt_models += 1
-                        grad = framework.models.fun_grad(framework.x_best)
-                        try:
-                            grad_alt = framework.models.fun_alt_grad(
-                                framework.x_best
-                            )
-                        except np.linalg.LinAlgError:
-                            status = ExitStatus.LINALG_ERROR
-                            break
-                        if np.linalg.norm(grad) < constants[
-                            Constants.LARGE_GRADIENT_FACTOR
-                        ] * np.linalg.norm(grad_alt):
-                            n_alt_models = 0
-                        if n_alt_models >= 3:
-                            try:
-                                framework.models.reset_models()
-                            except np.linalg.LinAlgError:
-                                status = ExitStatus.LINALG_ERROR
-                                break
-                            n_alt_models = 0
-
-                # Update the Lagrange multipliers.
-                framework.set_multipliers(framework.x_best + step)
-
-                # Check whether the resolution should be enhanced.
-                try:
-                    k_new, dist_new = framework.get_index_to_remove()
-                except np.linalg.LinAlgError:
-                    status = ExitStatus.LINALG_ERROR
-                    break
-                improve_geometry = (
-                    ill_conditioned
-                    or ratio <= constants[Constants.LOW_RATIO]
-                    and dist_new
-                    > max(
-                        framework.radius,
-                        constants[Constants.RESOLUTION_FACTOR]
-                        * framework.resolution,
-                    )
-                )
-                enhance_resolution = (
-                    radius_save <= framework.resolution
-                    and ratio <= constants[Constants.LOW_RATIO]
-                    and not improve_geometry
-                )
             else:
                 # When increasing the penalty parameter, the best point so far
                 # may change. In this case, we restart the iteration.
@@ -787,7 +792,7 @@ def minimize(
 
         # Reduce the resolution if necessary.
         if enhance_resolution:
-            if framework.resolution <= options[Options.RHOEND]:
+            if resolution <= radius_final:
                 success = True
                 status = ExitStatus.RADIUS_SUCCESS
                 break
@@ -795,15 +800,12 @@ def minimize(
             framework.decrease_penalty()
 
             if verbose:
-                maxcv_val = pb.maxcv(
-                    framework.x_best, framework.cub_best, framework.ceq_best
-                )
                 _print_step(
                     f"New trust-region radius: {framework.resolution}",
                     pb,
                     pb.build_x(framework.x_best),
                     framework.fun_best,
-                    maxcv_val,
+                    framework.maxcv_best,
                     pb.n_eval,
                     n_iter,
                 )
@@ -819,7 +821,14 @@ def minimize(
 
             # Evaluate the objective and constraint functions.
             try:
-                fun_val, cub_val, ceq_val = _eval(pb, framework, step, options)
+                fun_val, cub_val, ceq_val = _eval(
+                    pb,
+                    framework,
+                    step,
+                    max_eval,
+                    target,
+                    feasibility_tol,
+                )
             except TargetSuccess:
                 status = ExitStatus.TARGET_SUCCESS
                 success = True
@@ -838,7 +847,7 @@ def minimize(
 
             # Update the interpolation set.
             try:
-                framework.models.update_interpolation(
+                models.update_interpolation(
                     k_new,
                     framework.x_best + step,
                     fun_val,
@@ -860,12 +869,334 @@ def minimize(
     )
 
 
+def minimize_batch(
+    fun,
+    x0_batch,
+    args=(),
+    bounds=None,
+    constraints=(),
+    callback=None,
+    options=None,
+    vectorized=False,
+    **kwargs,
+):
+    """
+    Minimize a scalar function from several initial guesses using COBYQA.
+
+    Each initial guess starts an independent run of `minimize`, so that the
+    returned results are those that `minimize` would return for each initial
+    guess separately.
+
+    Parameters
+    ----------
+    fun : {callable, None}
+        Objective function to be minimized.
+
+            ``fun(x, *args) -> float``
+
+        where ``x`` is an array with shape (n,) and `args` is a tuple. If
+        `vectorized` is ``True``, the signature must instead be
+
+            ``fun(x, *args) -> array_like, shape (k,)``
+
+        where ``x`` is an array with shape (k, n), each row of which is a
+        point at which the objective function must be evaluated.
+    x0_batch : array_like, shape (m, n)
+        Initial guesses, one per row.
+    args : tuple, optional
+        Extra arguments passed to the objective function.
+    bounds : {`scipy.optimize.Bounds`, array_like, shape (n, 2)}, optional
+        Bound constraints of the problem. See `minimize` for details.
+    constraints : {Constraint, list}, optional
+        General constraints of the problem. See `minimize` for details.
+    callback : callable, optional
+        A callback executed at each objective function evaluation of each
+        run. See `minimize` for details. If `vectorized` is ``True``, the
+        runs are performed in separate threads, but the callback is never
+        called by several of them at the same time.
+    options : dict, optional
+        Options passed to the solver. See `minimize` for details.
+    vectorized : bool, optional
+        Whether `fun` can evaluate several points at once. If ``True``, the
+        runs are interleaved, and the points requested by all the runs that
+        are still active are evaluated with a single call to `fun`.
+
+    Other Parameters
+    ----------------
+    **kwargs
+        Constants passed to the solver. See `minimize` for details.
+
+    Returns
+    -------
+    list of `scipy.optimize.OptimizeResult`
+        Results of the optimization procedures, in the order of the initial
+        guesses in `x0_batch`.
+
+    Raises
+    ------
+    ValueError
+        If `x0_batch` is not a two-dimensional array.
+
+    See Also
+    --------
+    minimize : Minimize a scalar function from a single initial guess.
+
+    Notes
+    -----
+    The nonlinear constraint functions and the callback are always called
+    on one point at a time. When `vectorized` is ``True``, the runs are
+    performed in separate threads, which only wait for one another when
+    calling `fun`. One thread is started for each initial guess, so that
+    very large batches should be split into several calls. The order in
+    which the points are stacked in ``x`` is unspecified.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from scipy.optimize import rosen
+    >>> from cobyqa import minimize_batch
+
+    The Rosenbrock function can evaluate several points stacked in columns,
+    so that it can be vectorized as follows.
+
+    >>> def fun(x):
+    ...     return rosen(np.transpose(x))
+    >>> x0_batch = [[1.3, 0.7, 0.8], [-1.2, 1.0, 0.9]]
+    >>> res = minimize_batch(fun, x0_batch, vectorized=True)
+    >>> [np.round(r.x, 2) for r in res]
+    [array([1., 1., 1.]), array([1., 1., 1.])]
+    """
+    x0_batch = np.array(x0_batch, dtype=float)
+    if x0_batch.ndim != 2:
+        raise ValueError("The initial guesses must be a 2-dimensional array.")
+    if not vectorized or fun is None:
+        return [
+            minimize(
+                fun,
+                x0,
+                args,
+                bounds,
+                constraints,
+                callback,
+                options,
+                **kwargs,
+            )
+            for x0 in x0_batch
+        ]
+
+    # Run each optimization procedure in its own thread. The objective
+    # function calls are gathered by the batch objective function, which
+    # evaluates them all at once in the current thread.
+    if not isinstance(args, tuple):
+        args = (args,)
+    batch_fun = _BatchObjective(fun, args, x0_batch.shape[0])
+    batch_callback = batch_fun.serialize(callback)
+    results = [None] * x0_batch.shape[0]
+    errors = [None] * x0_batch.shape[0]
+
+    def run(i):
+        try:
+            results[i] = minimize(
+                batch_fun.instance(i),
+                x0_batch[i, :],
+                (),
+                bounds,
+                constraints,
+                batch_callback,
+                options,
+                **kwargs,
+            )
+        except BaseException as exc:
+            errors[i] = exc
+        finally:
+            batch_fun.finish()
+
+    threads = [
+        threading.Thread(target=run, args=(i,))
+        for i in range(x0_batch.shape[0])
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        batch_fun.serve()
+    finally:
+        for thread in threads:
+            thread.join()
+    for exc in errors:
+        if exc is not None:
+            raise exc
+    return results
+
+
+class _BatchObjective:
+    """
+    Objective function shared by several concurrent optimization procedures.
+    """
+
+    def __init__(self, fun, args, n_runs):
+        """
+        Initialize the shared objective function.
+
+        Parameters
+        ----------
+        fun : callable
+            Vectorized objective function.
+
+                ``fun(x, *args) -> array_like, shape (k,)``
+
+            where ``x`` is an array with shape (k, n) and `args` is a tuple.
+        args : tuple
+            Additional arguments to be passed to the function.
+        n_runs : int
+            Number of optimization procedures sharing the function.
+        """
+        self._fun = fun
+        self._args = args
+        self._n_active = n_runs
+        self._pending = {}
+        self._values = {}
+        self._error = None
+        self._condition = threading.Condition()
+
+    def instance(self, i):
+        """
+        Get the objective function of a given optimization procedure.
+
+        Parameters
+        ----------
+        i : int
+            Index of the optimization procedure.
+
+        Returns
+        -------
+        callable
+            Objective function of the optimization procedure, whose name is
+            the name of the shared objective function.
+        """
+
+        def fun(x):
+            return self._evaluate(i, x)
+
+        try:
+            fun.__name__ = self._fun.__name__
+        except AttributeError:
+            fun.__name__ = "fun"
+        return fun
+
+    def serialize(self, callback):
+        """
+        Get a callback that the optimization procedures call one at a time.
+
+        Parameters
+        ----------
+        callback : {callable, None}
+            Callback shared by the optimization procedures.
+
+        Returns
+        -------
+        {callable, None}
+            Callback with the same signature as `callback`, whose calls are
+            serialized, or ``None`` if `callback` is ``None``.
+        """
+        if callback is None:
+            return None
+
+        @functools.wraps(callback)
+        def serialized_callback(*args, **kwargs):
+            with self._condition:
+                return callback(*args, **kwargs)
+
+        return serialized_callback
+
+    def finish(self):
+        """
+        Notify that an optimization procedure has terminated.
+        """
+        with self._condition:
+            self._n_active -= 1
+            self._condition.notify_all()
+
+    def serve(self):
+        """
+        Evaluate the requested points until all the procedures terminate.
+
+        Each call to the vectorized objective function is made once all the
+        active optimization procedures wait for a function value. If an
+        exception is raised, either by the objective function or while
+        waiting, it is passed on to all the procedures before being raised.
+        """
+        try:
+            while True:
+                with self._condition:
+                    while (
+                        self._n_active > 0
+                        and len(self._pending) < self._n_active
+                    ):
+                        self._condition.wait()
+                    if self._n_active == 0:
+                        return
+                    pending = self._pending
+                    self._pending = {}
+                indices = list(pending)
+                values = np.reshape(
+                    np.asarray(
+                        self._fun(
+                            np.array([pending[i] for i in indices]),
+                            *self._args,
+                        ),
+                        dtype=float,
+                    ),
+                    (len(indices),),
+                )
+                with self._condition:
+                    self._values.update(zip(indices, values))
+                    self._condition.notify_all()
+        except BaseException as exc:
+            # Release the procedures waiting for a function value, so that
+            # their threads terminate.
+            with self._condition:
+                self._error = exc
+                self._condition.notify_all()
+            raise
+
+    def _evaluate(self, i, x):
+        """
+        Request an objective function value and wait until it is evaluated.
+
+        Parameters
+        ----------
+        i : int
+            Index of the optimization procedure.
+        x : `numpy.ndarray`, shape (n,)
+            Point at which the objective function is evaluated.
+
+        Returns
+        -------
+        float
+            Function value at `x`.
+        """
+        with self._condition:
+            if self._error is None:
+                self._pending[i] = np.copy(x)
+                self._condition.notify_all()
+                while i not in self._values and self._error is None:
+                    self._condition.wait()
+            if self._error is not None:
+                raise self._error
+            return self._values.pop(i)
+
+
 def _get_bounds(bounds, n):
     """
     Uniformize the bounds.
     """
     if bounds is None:
-        return Bounds(np.full(n, -np.inf), np.full(n, np.inf))
+        # The bounds are copied by BoundConstraints, so that read-only views
+        # can be used here instead of allocating new arrays.
+        return Bounds(
+            np.broadcast_to(-np.inf, (n,)),
+            np.broadcast_to(np.inf, (n,)),
+        )
     elif isinstance(bounds, Bounds):
         if bounds.lb.shape != (n,) or bounds.ub.shape != (n,):
             raise ValueError(f"The bounds must have {n} elements.")
@@ -958,103 +1289,99 @@ def _set_default_options(options, n):
     """
     Set the default options.
     """
-    if Options.RHOBEG in options and options[Options.RHOBEG] <= 0.0:
+    # Accessing the members of an enumeration and their values is slow
+    # compared to accessing local variables, so the keys are bound once.
+    debug_key = Options.DEBUG.value
+    feasibility_tol_key = Options.FEASIBILITY_TOL.value
+    filter_size_key = Options.FILTER_SIZE.value
+    history_size_key = Options.HISTORY_SIZE.value
+    max_eval_key = Options.MAX_EVAL.value
+    max_iter_key = Options.MAX_ITER.value
+    npt_key = Options.NPT.value
+    rhobeg_key = Options.RHOBEG.value
+    rhoend_key = Options.RHOEND.value
+    scale_key = Options.SCALE.value
+    store_history_key = Options.STORE_HISTORY.value
+    target_key = Options.TARGET.value
+    verbose_key = Options.VERBOSE.value
+
+    if rhobeg_key in options and options[rhobeg_key] <= 0.0:
         raise ValueError("The initial trust-region radius must be positive.")
-    if Options.RHOEND in options and options[Options.RHOEND] < 0.0:
+    if rhoend_key in options and options[rhoend_key] < 0.0:
         raise ValueError("The final trust-region radius must be nonnegative.")
-    if Options.RHOBEG in options and Options.RHOEND in options:
-        if options[Options.RHOBEG] < options[Options.RHOEND]:
+    if rhobeg_key in options and rhoend_key in options:
+        if options[rhobeg_key] < options[rhoend_key]:
             raise ValueError(
                 "The initial trust-region radius must be greater "
                 "than or equal to the final trust-region radius."
             )
-    elif Options.RHOBEG in options:
-        options[Options.RHOEND.value] = np.min(
-            [
-                DEFAULT_OPTIONS[Options.RHOEND],
-                options[Options.RHOBEG],
-            ]
+    elif rhobeg_key in options:
+        options[rhoend_key] = min(
+            DEFAULT_OPTIONS[rhoend_key],
+            options[rhobeg_key],
         )
-    elif Options.RHOEND in options:
-        options[Options.RHOBEG.value] = np.max(
-            [
-                DEFAULT_OPTIONS[Options.RHOBEG],
-                options[Options.RHOEND],
-            ]
+    elif rhoend_key in options:
+        options[rhobeg_key] = max(
+            DEFAULT_OPTIONS[rhobeg_key],
+            options[rhoend_key],
         )
     else:
-        options[Options.RHOBEG.value] = DEFAULT_OPTIONS[Options.RHOBEG]
-        options[Options.RHOEND.value] = DEFAULT_OPTIONS[Options.RHOEND]
-    options[Options.RHOBEG.value] = float(options[Options.RHOBEG])
-    options[Options.RHOEND.value] = float(options[Options.RHOEND])
-    if Options.NPT in options and options[Options.NPT] <= 0:
+        options[rhobeg_key] = DEFAULT_OPTIONS[rhobeg_key]
+        options[rhoend_key] = DEFAULT_OPTIONS[rhoend_key]
+    options[rhobeg_key] = float(options[rhobeg_key])
+    options[rhoend_key] = float(options[rhoend_key])
+    if npt_key in options and options[npt_key] <= 0:
         raise ValueError("The number of interpolation points must be "
                          "positive.")
-    if (
-        Options.NPT in options
-        and options[Options.NPT] > ((n + 1) * (n + 2)) // 2
-    ):
+    if npt_key in options and options[npt_key] > ((n + 1) * (n + 2)) // 2:
         raise ValueError(
             f"The number of interpolation points must be at most "
             f"{((n + 1) * (n + 2)) // 2}."
         )
-    options.setdefault(Options.NPT.value, DEFAULT_OPTIONS[Options.NPT](n))
-    options[Options.NPT.value] = int(options[Options.NPT])
-    if Options.MAX_EVAL in options and options[Options.MAX_EVAL] <= 0:
+    options.setdefault(npt_key, DEFAULT_OPTIONS[npt_key](n))
+    options[npt_key] = int(options[npt_key])
+    if max_eval_key in options and options[max_eval_key] <= 0:
         raise ValueError(
             "The maximum number of function evaluations must be positive."
         )
     options.setdefault(
-        Options.MAX_EVAL.value,
-        np.max(
-            [
-                DEFAULT_OPTIONS[Options.MAX_EVAL](n),
-                options[Options.NPT] + 1,
-            ]
-        ),
+        max_eval_key,
+        max(DEFAULT_OPTIONS[max_eval_key](n), options[npt_key] + 1),
     )
-    options[Options.MAX_EVAL.value] = int(options[Options.MAX_EVAL])
-    if Options.MAX_ITER in options and options[Options.MAX_ITER] <= 0:
+    options[max_eval_key] = int(options[max_eval_key])
+    if max_iter_key in options and options[max_iter_key] <= 0:
         raise ValueError("The maximum number of iterations must be positive.")
+    options.setdefault(max_iter_key, DEFAULT_OPTIONS[max_iter_key](n))
+    options[max_iter_key] = int(options[max_iter_key])
+    options.setdefault(target_key, DEFAULT_OPTIONS[target_key])
+    options[target_key] = float(options[target_key])
     options.setdefault(
-        Options.MAX_ITER.value,
-        DEFAULT_OPTIONS[Options.MAX_ITER](n),
-    )
-    options[Options.MAX_ITER.value] = int(options[Options.MAX_ITER])
-    options.setdefault(Options.TARGET.value, DEFAULT_OPTIONS[Options.TARGET])
-    options[Options.TARGET.value] = float(options[Options.TARGET])
-    options.setdefault(
-        Options.FEASIBILITY_TOL.value,
-        DEFAULT_OPTIONS[Options.FEASIBILITY_TOL],
+        feasibility_tol_key,
+        DEFAULT_OPTIONS[feasibility_tol_key],
     )
-    options[Options.FEASIBILITY_TOL.value] = float(
-        options[Options.FEASIBILITY_TOL]
-    )
-    options.setdefault(Options.VERBOSE.value, DEFAULT_OPTIONS[Options.VERBOSE])
-    options[Options.VERBOSE.value] = bool(options[Options.VERBOSE])
-    options.setdefault(Options.SCALE.value, DEFAULT_OPTIONS[Options.SCALE])
-    options[Options.SCALE.value] = bool(options[Options.SCALE])
+    options[feasibility_tol_key] = float(options[feasibility_tol_key])
+    options.setdefault(verbose_key, DEFAULT_OPTIONS[verbose_key])
+    options[verbose_key] = bool(options[verbose_key])
+    options.setdefault(scale_key, DEFAULT_OPTIONS[scale_key])
+    options[scale_key] = bool(options[scale_key])
+    options.setdefault(filter_size_key, DEFAULT_OPTIONS[filter_size_key])
+    options[filter_size_key] = int(options[filter_size_key])
     options.setdefault(
-        Options.FILTER_SIZE.value,
-        DEFAULT_OPTIONS[Options.FILTER_SIZE],
+        store_history_key,
+        DEFAULT_OPTIONS[store_history_key],
     )
-    options[Options.FILTER_SIZE.value] = int(options[Options.FILTER_SIZE])
+    options[store_history_key] = bool(options[store_history_key])
     options.setdefault(
-        Options.STORE_HISTORY.value,
-        DEFAULT_OPTIONS[Options.STORE_HISTORY],
+        history_size_key,
+        DEFAULT_OPTIONS[history_size_key],
     )
-    options[Options.STORE_HISTORY.value] = bool(options[Options.STORE_HISTORY])
-    options.setdefault(
-        Options.HISTORY_SIZE.value,
-        DEFAULT_OPTIONS[Options.HISTORY_SIZE],
-    )
-    options[Options.HISTORY_SIZE.value] = int(options[Options.HISTORY_SIZE])
-    options.setdefault(Options.DEBUG.value, DEFAULT_OPTIONS[Options.DEBUG])
-    options[Options.DEBUG.value] = bool(options[Options.DEBUG])
+    options[history_size_key] = int(options[history_size_key])
+    options.setdefault(debug_key, DEFAULT_OPTIONS[debug_key])
+    options[debug_key] = bool(options[debug_key])
 
     # Check whether they are any unknown options.
     for key in options:
-        if key not in Options.__members__.values():
+        if key not in _OPTIONS_NAMES:
             warnings.warn(f"Unknown option: {key}.", RuntimeWarning, 3)
 
 
@@ -1396,30 +1723,104 @@ def _set_default_constants(**kwargs):
 
     # Check whether they are any unknown options.
     for key in kwargs:
-        if key not in Constants.__members__.values():
+        if key not in _CONSTANTS_NAMES:
             warnings.warn(f"Unknown constant: {key}.", RuntimeWarning, 3)
     return constants
 
 
-def _eval(pb, framework, step, options):
+def _eval(pb, framework, step, max_eval, target, feasibility_tol):
     """
     Evaluate the objective and constraint functions.
     """
-    if pb.n_eval >= options[Options.MAX_EVAL]:
+    if pb.n_eval >= max_eval:
         raise MaxEvalError
     x_eval = framework.x_best + step
     fun_val, cub_val, ceq_val = pb(x_eval)
-    r_val = pb.maxcv(x_eval, cub_val, ceq_val)
-    if (
-        fun_val <= options[Options.TARGET]
-        and r_val <= options[Options.FEASIBILITY_TOL]
-    ):
-        raise TargetSuccess
-    if pb.is_feasibility and r_val <= options[Options.FEASIBILITY_TOL]:
-        raise FeasibleSuccess
+
+    # The maximum constraint violation is only needed to check the stopping
+    # criteria, which cannot be met unless the target is reached or the
+    # problem is a feasibility problem.
+    if fun_val <= target or pb.is_feasibility:
+        r_val = pb.maxcv(x_eval, cub_val, ceq_val)
+        if fun_val <= target and r_val <= feasibility_tol:
+            raise TargetSuccess
+        if pb.is_feasibility and r_val <= feasibility_tol:
+            raise FeasibleSuccess
     return fun_val, cub_val, ceq_val
 
 
+def _classical_iteration(
+    framework,
+    x_best,
+    step,
+    fun_val,
+    cub_val,
+    ceq_val,
+    radius_save,
+    n_alt_models,
+    constants,
+):
+    """
+    Update the framework after evaluating a trust-region trial point.
+    """
+    models = framework.models
+
+    # Calculate the reduction ratio.
+    ratio = framework.get_reduction_ratio(step, fun_val, cub_val, ceq_val)
+
+    # Choose an interpolation point to remove, and update the interpolation
+    # set accordingly.
+    x_new = x_best + step
+    k_new = framework.get_index_to_remove(x_new)[0]
+    ill_conditioned = models.update_interpolation(
+        k_new, x_new, fun_val, cub_val, ceq_val
+    )
+    framework.set_best_index()
+    x_best = framework.x_best
+
+    # Update the trust-region radius.
+    framework.update_radius(step, ratio)
+    radius = framework.radius
+    resolution = framework.resolution
+
+    # Attempt to replace the models by the alternative ones.
+    if radius <= resolution:
+        if ratio >= constants[Constants.VERY_LOW_RATIO]:
+            n_alt_models = 0
+        else:
+            n_alt_models += 1
+            grad = models.fun_grad(x_best)
+            grad_alt = models.fun_alt_grad(x_best)
+            if (
+                _norm_sq(grad)
+                < (constants[Constants.LARGE_GRADIENT_FACTOR] ** 2.0)
+                * _norm_sq(grad_alt)
+            ):
+                n_alt_models = 0
+            if n_alt_models >= 3:
+                models.reset_models()
+                n_alt_models = 0
+
+    # Update the Lagrange multipliers.
+    framework.set_multipliers(x_best + step)
+
+    # Check whether the resolution should be enhanced.
+    k_new, dist_new = framework.get_index_to_remove()
+    low_ratio = constants[Constants.LOW_RATIO]
+    improve_geometry = (
+        ill_conditioned
+        or ratio <= low_ratio
+        and dist_new
+        > max(radius, constants[Constants.RESOLUTION_FACTOR] * resolution)
+    )
+    enhance_resolution = (
+        radius_save <= resolution
+        and ratio <= low_ratio
+        and not improve_geometry
+    )
+    return k_new, n_alt_models, enhance_resolution, improve_geometry
+
+
 def _build_result(pb, penalty, success, status, n_iter, options):
     """
     Build the result of the optimization process.
@@ -1427,27 +1828,10 @@ def _build_result(pb, penalty, success, status, n_iter, options):
     # Build the result.
     x, fun, maxcv = pb.best_eval(penalty)
     success = success and np.isfinite(fun) and np.isfinite(maxcv)
-    if status not in [ExitStatus.TARGET_SUCCESS, ExitStatus.FEASIBLE_SUCCESS]:
+    if status not in _FEASIBLE_STATUSES:
         success = success and maxcv <= options[Options.FEASIBILITY_TOL]
     result = OptimizeResult()
-    result.message = {
-        ExitStatus.RADIUS_SUCCESS: "The lower bound for the trust-region "
-                                   "radius has been reached",
-        ExitStatus.TARGET_SUCCESS: "The target objective function value has "
-                                   "been reached",
-        ExitStatus.FIXED_SUCCESS: "All variables are fixed by the bound "
-                                  "constraints",
-        ExitStatus.CALLBACK_SUCCESS: "The callback requested to stop the "
-                                     "optimization procedure",
-        ExitStatus.FEASIBLE_SUCCESS: "The feasibility problem received has "
-                                     "been solved successfully",
-        ExitStatus.MAX_EVAL_WARNING: "The maximum number of function "
-                                     "evaluations has been exceeded",
-        ExitStatus.MAX_ITER_WARNING: "The maximum number of iterations has "
-                                     "been exceeded",
-        ExitStatus.INFEASIBLE_ERROR: "The bound constraints are infeasible",
-        ExitStatus.LINALG_ERROR: "A linear algebra error occurred",
-    }.get(status, "Unknown exit status")
+    result.message = _STATUS_MESSAGES.get(status, "Unknown exit status")
     result.success = success
     result.status = status.value
     result.x = pb.build_x(x)
@@ -1473,6 +1857,46 @@ def _build_result(pb, penalty, success, status, n_iter, options):
     return result
 
 
+def _update_short_steps(
+    s_norm,
+    resolution,
+    radius_save,
+    n_short_steps,
+    n_very_short_steps,
+):
+    """
+    Update the numbers of consecutive short and very short steps.
+    """
+    # Count the consecutive short and very short steps. Both counters are
+    # reset if the trust-region radius was above the resolution, and the
+    # latter is also reset if the step is not very short.
+    is_short = radius_save <= resolution
+    is_very_short = is_short and s_norm <= 0.1 * resolution
+    n_short_steps = (n_short_steps + 1) * is_short
+    n_very_short_steps = (n_very_short_steps + 1) * is_very_short
+
+    # The counters are also reset when the resolution is enhanced.
+    enhance_resolution = n_short_steps >= 5 or n_very_short_steps >= 3
+    if enhance_resolution:
+        n_short_steps = 0
+        n_very_short_steps = 0
+    return n_short_steps, n_very_short_steps, enhance_resolution
+
+
+def _norm(v):
+    """
+    Evaluate the Euclidean norm of a vector.
+    """
+    return math.sqrt(v.dot(v))
+
+
+def _norm_sq(v):
+    """
+    Evaluate the squared Euclidean norm of a vector.
+    """
+    return float(v.dot(v))
+
+
 def _print_step(message, pb, x, fun_val, r_val, n_eval, n_iter):
     """
     Print information about the current state of the optimization process.
@@ -1,3 +1,4 @@
+import threading
 import warnings
 
 import numpy as np
@@ -42,52 +43,61 @@ class Interpolation:
                 ]
             )
 
-        # Set the initial point around which the models are expanded.
-        self._x_base = np.copy(pb.x0)
-        very_close_xl_idx = (
-            self.x_base <= pb.bounds.xl + 0.5 * options[Options.RHOBEG]
+        # Set the initial point around which the models are expanded. The
+        # points close to the upper bounds are computed from those already
+        # moved away from the lower bounds.
+        radius_init = options[Options.RHOBEG]
+        very_close_xl_idx = pb.x0 <= pb.bounds.xl + 0.5 * radius_init
+        close_xl_idx = (pb.bounds.xl + 0.5 * radius_init < pb.x0) & (
+            pb.x0 <= pb.bounds.xl + radius_init
         )
-        self.x_base[very_close_xl_idx] = pb.bounds.xl[very_close_xl_idx]
-        close_xl_idx = (
-            pb.bounds.xl + 0.5 * options[Options.RHOBEG] < self.x_base
-        ) & (self.x_base <= pb.bounds.xl + options[Options.RHOBEG])
-        self.x_base[close_xl_idx] = np.minimum(
-            pb.bounds.xl[close_xl_idx] + options[Options.RHOBEG],
-            pb.bounds.xu[close_xl_idx],
+        self._x_base = np.select(
+            [very_close_xl_idx, close_xl_idx],
+            [
+                pb.bounds.xl,
+                np.minimum(pb.bounds.xl + radius_init, pb.bounds.xu),
+            ],
+            pb.x0,
         )
         very_close_xu_idx = (
-            self.x_base >= pb.bounds.xu - 0.5 * options[Options.RHOBEG]
+            self.x_base >= pb.bounds.xu - 0.5 * radius_init
+        )
+        close_xu_idx = (self.x_base < pb.bounds.xu - 0.5 * radius_init) & (
+            pb.bounds.xu - radius_init <= self.x_base
         )
-        self.x_base[very_close_xu_idx] = pb.bounds.xu[very_close_xu_idx]
-        close_xu_idx = (
-            self.x_base < pb.bounds.xu - 0.5 * options[Options.RHOBEG]
-        ) & (pb.bounds.xu - options[Options.RHOBEG] <= self.x_base)
-        self.x_base[close_xu_idx] = np.maximum(
-            pb.bounds.xu[close_xu_idx] - options[Options.RHOBEG],
-            pb.bounds.xl[close_xu_idx],
+        self._x_base = np.select(
+            [very_close_xu_idx, close_xu_idx],
+            [
+                pb.bounds.xu,
+                np.maximum(pb.bounds.xu - radius_init, pb.bounds.xl),
+            ],
+            self.x_base,
         )
 
         # Set the initial interpolation set.
-        self._xpt = np.zeros((pb.n, options[Options.NPT]))
-        for k in range(1, options[Options.NPT]):
-            if k <= pb.n:
-                if very_close_xu_idx[k - 1]:
-                    self.xpt[k - 1, k] = -options[Options.RHOBEG]
-                else:
-                    self.xpt[k - 1, k] = options[Options.RHOBEG]
-            elif k <= 2 * pb.n:
-                if very_close_xl_idx[k - pb.n - 1]:
-                    self.xpt[k - pb.n - 1, k] = 2.0 * options[Options.RHOBEG]
-                elif very_close_xu_idx[k - pb.n - 1]:
-                    self.xpt[k - pb.n - 1, k] = -2.0 * options[Options.RHOBEG]
-                else:
-                    self.xpt[k - pb.n - 1, k] = -options[Options.RHOBEG]
-            else:
-                spread = (k - pb.n - 1) // pb.n
-                k1 = k - (1 + spread) * pb.n - 1
-                k2 = (k1 + spread) % pb.n
-                self.xpt[k1, k] = self.xpt[k1, k1 + 1]
-                self.xpt[k2, k] = self.xpt[k2, k2 + 1]
+        # For 1 <= k <= n, the k-th and (n + k)-th points are two different
+        # steps along the k-th coordinate, and the remaining points combine
+        # steps along two different coordinates.
+        npt = options[Options.NPT]
+        self._xpt = np.zeros((pb.n, npt))
+        k = np.arange(1, min(npt - 1, pb.n) + 1)
+        self.xpt[k - 1, k] = np.where(
+            very_close_xu_idx[k - 1],
+            -options[Options.RHOBEG],
+            options[Options.RHOBEG],
+        )
+        k = np.arange(pb.n + 1, min(npt - 1, 2 * pb.n) + 1)
+        self.xpt[k - pb.n - 1, k] = np.select(
+            [very_close_xl_idx[k - pb.n - 1], very_close_xu_idx[k - pb.n - 1]],
+            [2.0 * options[Options.RHOBEG], -2.0 * options[Options.RHOBEG]],
+            -options[Options.RHOBEG],
+        )
+        k = np.arange(2 * pb.n + 1, npt)
+        spread = (k - pb.n - 1) // pb.n
+        k1 = k - (1 + spread) * pb.n - 1
+        k2 = (k1 + spread) % pb.n
+        self.xpt[k1, k] = self.xpt[k1, k1 + 1]
+        self.xpt[k2, k] = self.xpt[k2, k2 + 1]
 
     @property
     def n(self):
@@ -191,7 +201,23 @@ class Interpolation:
         return self.x_base + self.xpt[:, k]
 
 
-_cache = {"xpt": None, "a": None, "right_scaling": None, "eigh": None}
+class _SystemCache(threading.local):
+    """
+    Last interpolation system built, stored separately for each thread.
+
+    Concurrent optimization procedures, such as those run by
+    `cobyqa.minimize_batch`, must neither share nor overwrite each other's
+    interpolation systems.
+    """
+
+    def __init__(self):
+        self.xpt = None
+        self.a = None
+        self.right_scaling = None
+        self.eigh = None
+
+
+_cache = _SystemCache()
 
 
 def build_system(interpolation):
@@ -211,21 +237,24 @@ def build_system(interpolation):
     # Compute the scaled directions from the base point to the
     # interpolation points. We scale the directions to avoid numerical
     # difficulties.
-    if _cache["xpt"] is not None and np.array_equal(
-        interpolation.xpt, _cache["xpt"]
+    if _cache.xpt is not None and np.array_equal(
+        interpolation.xpt, _cache.xpt
     ):
-        return _cache["a"], _cache["right_scaling"], _cache["eigh"]
+        return _cache.a, _cache.right_scaling, _cache.eigh
 
     scale = np.max(np.linalg.norm(interpolation.xpt, axis=0), initial=EPS)
     xpt_scale = interpolation.xpt / scale
 
     n, npt = xpt_scale.shape
     a = np.zeros((npt + n + 1, npt + n + 1))
-    a[:npt, :npt] = 0.5 * (xpt_scale.T @ xpt_scale) ** 2.0
+    # The matrix is symmetric. Its blocks are computed once and mirrored.
+    xpt_gram = xpt_scale.T @ xpt_scale
+    xpt_gram *= xpt_gram
+    np.multiply(0.5, xpt_gram, out=a[:npt, :npt])
     a[:npt, npt] = 1.0
-    a[:npt, npt + 1:] = xpt_scale.T
     a[npt, :npt] = 1.0
     a[npt + 1:, :npt] = xpt_scale
+    a[:npt, npt + 1:] = a[npt + 1:, :npt].T
 
     # Build the left and right scaling diagonal matrices.
     right_scaling = np.empty(npt + n + 1)
@@ -235,10 +264,10 @@ def build_system(interpolation):
 
     eig_values, eig_vectors = eigh(a, check_finite=False)
 
-    _cache["xpt"] = np.copy(interpolation.xpt)
-    _cache["a"] = np.copy(a)
-    _cache["right_scaling"] = np.copy(right_scaling)
-    _cache["eigh"] = (eig_values, eig_vectors)
+    _cache.xpt = np.copy(interpolation.xpt)
+    _cache.a = np.copy(a)
+    _cache.right_scaling = np.copy(right_scaling)
+    _cache.eigh = (eig_values, eig_vectors)
 
     return a, right_scaling, (eig_values, eig_vectors)
 
@@ -277,21 +306,15 @@ class Quadratic:
         `numpy.linalg.LinAlgError`
             If the interpolation system is ill-defined.
         """
-        self._debug = debug
-        if self._debug:
+        if debug:
             assert values.shape == (
                 interpolation.npt,
             ), "The shape of `values` is not valid."
-        if interpolation.npt < interpolation.n + 1:
-            raise ValueError(
-                f"The number of interpolation points must be at least "
-                f"{interpolation.n + 1}."
-            )
-        self._const, self._grad, self._i_hess, _ = self._get_model(
+        const, grad, i_hess = self._build(
             interpolation,
-            values,
+            values[:, np.newaxis],
         )
-        self._e_hess = np.zeros((self.n, self.n))
+        self._initialize(const[0], grad[0], i_hess[0], debug)
 
     def __call__(self, x, interpolation):
         """
@@ -312,13 +335,14 @@ class Quadratic:
         if self._debug:
             assert x.shape == (self.n,), "The shape of `x` is not valid."
         x_diff = x - interpolation.x_base
+        x_diff_xpt = interpolation.xpt.T.dot(x_diff)
         return (
             self._const
-            + self._grad @ x_diff
+            + self._grad.dot(x_diff)
             + 0.5
             * (
-                self._i_hess @ (interpolation.xpt.T @ x_diff) ** 2.0
-                + x_diff @ self._e_hess @ x_diff
+                self._i_hess.dot(x_diff_xpt * x_diff_xpt)
+                + x_diff.dot(self._e_hess).dot(x_diff)
             )
         )
 
@@ -381,8 +405,8 @@ class Quadratic:
         `numpy.ndarray`, shape (n, n)
             Hessian matrix of the quadratic model.
         """
-        return self._e_hess + interpolation.xpt @ (
-            self._i_hess[:, np.newaxis] * interpolation.xpt.T
+        return self._e_hess + (interpolation.xpt * self._i_hess).dot(
+            interpolation.xpt.T
         )
 
     def hess_prod(self, v, interpolation):
@@ -406,8 +430,8 @@ class Quadratic:
         """
         if self._debug:
             assert v.shape == (self.n,), "The shape of `v` is not valid."
-        return self._e_hess @ v + interpolation.xpt @ (
-            self._i_hess * (interpolation.xpt.T @ v)
+        return self._e_hess.dot(v) + interpolation.xpt.dot(
+            self._i_hess * interpolation.xpt.T.dot(v)
         )
 
     def curv(self, v, interpolation):
@@ -429,10 +453,8 @@ class Quadratic:
         """
         if self._debug:
             assert v.shape == (self.n,), "The shape of `v` is not valid."
-        return (
-            v @ self._e_hess @ v
-            + self._i_hess @ (interpolation.xpt.T @ v) ** 2.0
-        )
+        v_xpt = interpolation.xpt.T.dot(v)
+        return v.dot(self._e_hess).dot(v) + self._i_hess.dot(v_xpt * v_xpt)
 
     def update(self, interpolation, k_new, dir_old, values_diff):
         """
@@ -468,23 +490,13 @@ class Quadratic:
             assert values_diff.shape == (
                 self.npt,
             ), "The shape of `values_diff` is not valid."
-
-        # Forward the k_new-th element of the implicit Hessian matrix to the
-        # explicit Hessian matrix. This must be done because the implicit
-        # Hessian matrix is related to the interpolation points, and the
-        # k_new-th interpolation point is modified.
-        self._e_hess += self._i_hess[k_new] * np.outer(dir_old, dir_old)
-        self._i_hess[k_new] = 0.0
-
-        # Update the quadratic model.
-        const, grad, i_hess, ill_conditioned = self._get_model(
+        return Quadratic.batch_update(
+            np.array([self]),
             interpolation,
-            values_diff,
+            k_new,
+            dir_old,
+            values_diff[:, np.newaxis],
         )
-        self._const += const
-        self._grad += grad
-        self._i_hess += i_hess
-        return ill_conditioned
 
     def shift_x_base(self, interpolation, new_x_base):
         """
@@ -501,14 +513,342 @@ class Quadratic:
             assert new_x_base.shape == (
                 self.n,
             ), "The shape of `new_x_base` is not valid."
-        self._const = self(new_x_base, interpolation)
-        self._grad = self.grad(new_x_base, interpolation)
-        shift = new_x_base - interpolation.x_base
-        update = np.outer(
-            shift,
-            (interpolation.xpt - 0.5 * shift[:, np.newaxis]) @ self._i_hess,
+        Quadratic.batch_shift_x_base(
+            np.array([self]),
+            interpolation,
+            new_x_base,
+        )
+
+    @staticmethod
+    def stack(models):
+        """
+        Stack the coefficients of several quadratic models.
+
+        Parameters
+        ----------
+        models : `numpy.ndarray`, shape (m,)
+            Quadratic models to stack.
+
+        Returns
+        -------
+        `numpy.ndarray`, shape (m,)
+            Constant terms of the quadratic models.
+        `numpy.ndarray`, shape (m, n)
+            Gradients of the quadratic models at ``interpolation.x_base``.
+        `numpy.ndarray`, shape (m, npt)
+            Implicit Hessian matrices of the quadratic models.
+        `numpy.ndarray`, shape (m, n, n)
+            Explicit Hessian matrices of the quadratic models.
+        """
+        return (
+            np.array([model._const for model in models]),
+            np.array([model._grad for model in models]),
+            np.array([model._i_hess for model in models]),
+            np.array([model._e_hess for model in models]),
+        )
+
+    @staticmethod
+    def batch_call(coefficients, x, interpolation):
+        """
+        Evaluate several quadratic models at a given point.
+
+        Parameters
+        ----------
+        coefficients : tuple
+            Stacked coefficients of the quadratic models to evaluate, as
+            returned by `Quadratic.stack`.
+        x : `numpy.ndarray`, shape (n,)
+            Point at which the quadratic models are evaluated.
+        interpolation : `cobyqa.models.Interpolation`
+            Interpolation set.
+
+        Returns
+        -------
+        `numpy.ndarray`, shape (m,)
+            Values of the quadratic models at `x`.
+        """
+        const, grad, i_hess, e_hess = coefficients
+        if const.size == 0:
+            return np.empty(0)
+        x_diff = x - interpolation.x_base
+        x_diff_xpt = interpolation.xpt.T.dot(x_diff)
+        return (
+            const
+            + Quadratic._batch_dot(grad, x_diff)
+            + 0.5
+            * (
+                Quadratic._batch_dot(i_hess, x_diff_xpt * x_diff_xpt)
+                + Quadratic._batch_dot(np.matmul(x_diff, e_hess), x_diff)
+            )
         )
-        self._e_hess += update + update.T
+
+    @staticmethod
+    def batch_call_xpt(coefficients, interpolation):
+        """
+        Evaluate several quadratic models at all the interpolation points.
+
+        Parameters
+        ----------
+        coefficients : tuple
+            Stacked coefficients of the quadratic models to evaluate, as
+            returned by `Quadratic.stack`.
+        interpolation : `cobyqa.models.Interpolation`
+            Interpolation set.
+
+        Returns
+        -------
+        `numpy.ndarray`, shape (m, npt)
+            Values of the quadratic models at the interpolation points.
+        """
+        const, grad, i_hess, e_hess = coefficients
+        if const.size == 0:
+            return np.empty((0, interpolation.npt))
+        xpt = interpolation.xpt
+        xpt_gram = xpt.T.dot(xpt)
+        return (
+            const[:, np.newaxis]
+            + grad.dot(xpt)
+            + 0.5
+            * (
+                i_hess.dot(xpt_gram * xpt_gram)
+                + np.sum(xpt * np.matmul(e_hess, xpt), axis=1)
+            )
+        )
+
+    @staticmethod
+    def batch_grad(coefficients, x, interpolation):
+        """
+        Evaluate the gradients of several quadratic models at a given point.
+
+        Parameters
+        ----------
+        coefficients : tuple
+            Stacked coefficients of the quadratic models whose gradients are
+            evaluated, as returned by `Quadratic.stack`.
+        x : `numpy.ndarray`, shape (n,)
+            Point at which the gradients of the quadratic models are evaluated.
+        interpolation : `cobyqa.models.Interpolation`
+            Interpolation set.
+
+        Returns
+        -------
+        `numpy.ndarray`, shape (m, n)
+            Gradients of the quadratic models at `x`.
+        """
+        _, grad, i_hess, e_hess = coefficients
+        if grad.size == 0:
+            return np.empty((0, interpolation.n))
+        x_diff = x - interpolation.x_base
+        return grad + Quadratic._batch_hess_prod(
+            i_hess,
+            e_hess,
+            x_diff,
+            interpolation,
+        )
+
+    @staticmethod
+    def batch_hess(coefficients, interpolation):
+        """
+        Evaluate the Hessian matrices of several quadratic models.
+
+        Parameters
+        ----------
+        coefficients : tuple
+            Stacked coefficients of the quadratic models whose Hessian
+            matrices are evaluated, as returned by `Quadratic.stack`.
+        interpolation : `cobyqa.models.Interpolation`
+            Interpolation set.
+
+        Returns
+        -------
+        `numpy.ndarray`, shape (m, n, n)
+            Hessian matrices of the quadratic models.
+        """
+        _, _, i_hess, e_hess = coefficients
+        if e_hess.size == 0:
+            return np.empty((0, interpolation.n, interpolation.n))
+        return e_hess + np.matmul(
+            interpolation.xpt * i_hess[:, np.newaxis, :],
+            interpolation.xpt.T,
+        )
+
+    @staticmethod
+    def batch_hess_prod(coefficients, v, interpolation):
+        """
+        Evaluate the right products of the Hessian matrices of several
+        quadratic models with a given vector.
+
+        Parameters
+        ----------
+        coefficients : tuple
+            Stacked coefficients of the quadratic models whose Hessian
+            matrices are considered, as returned by `Quadratic.stack`.
+        v : `numpy.ndarray`, shape (n,)
+            Vector with which the Hessian matrices of the quadratic models are
+            multiplied from the right.
+        interpolation : `cobyqa.models.Interpolation`
+            Interpolation set.
+
+        Returns
+        -------
+        `numpy.ndarray`, shape (m, n)
+            Right products of the Hessian matrices of the quadratic models with
+            `v`.
+        """
+        _, _, i_hess, e_hess = coefficients
+        if e_hess.size == 0:
+            return np.empty((0, interpolation.n))
+        return Quadratic._batch_hess_prod(i_hess, e_hess, v, interpolation)
+
+    @staticmethod
+    def batch_curv(coefficients, v, interpolation):
+        """
+        Evaluate the curvatures of several quadratic models along a given
+        direction.
+
+        Parameters
+        ----------
+        coefficients : tuple
+            Stacked coefficients of the quadratic models whose curvatures are
+            evaluated, as returned by `Quadratic.stack`.
+        v : `numpy.ndarray`, shape (n,)
+            Direction along which the curvatures of the quadratic models are
+            evaluated.
+        interpolation : `cobyqa.models.Interpolation`
+            Interpolation set.
+
+        Returns
+        -------
+        `numpy.ndarray`, shape (m,)
+            Curvatures of the quadratic models along `v`.
+        """
+        _, _, i_hess, e_hess = coefficients
+        if e_hess.size == 0:
+            return np.empty(0)
+        v_xpt = interpolation.xpt.T.dot(v)
+        return (
+            Quadratic._batch_dot(np.matmul(v, e_hess), v)
+            + Quadratic._batch_dot(i_hess, v_xpt * v_xpt)
+        )
+
+    @staticmethod
+    def batch_new(interpolation, values, debug):
+        """
+        Build several quadratic models on the same interpolation set.
+
+        The interpolation systems of all the models share the same left-hand
+        side matrix, and are hence solved together.
+
+        Parameters
+        ----------
+        interpolation : `cobyqa.models.Interpolation`
+            Interpolation set.
+        values : `numpy.ndarray`, shape (npt, m)
+            Values of the interpolated functions at the interpolation points.
+        debug : bool
+            Whether to make debugging tests during the execution.
+
+        Returns
+        -------
+        `numpy.ndarray`, shape (m,)
+            Quadratic models of the interpolated functions.
+
+        Raises
+        ------
+        `numpy.linalg.LinAlgError`
+            If the interpolation system is ill-defined.
+        """
+        if debug:
+            assert (
+                values.ndim == 2 and values.shape[0] == interpolation.npt
+            ), "The shape of `values` is not valid."
+        const, grad, i_hess = Quadratic._build(interpolation, values)
+        models = np.empty(values.shape[1], dtype=Quadratic)
+        for i in range(values.shape[1]):
+            models[i] = Quadratic.__new__(Quadratic)
+            models[i]._initialize(const[i], grad[i], i_hess[i], debug)
+        return models
+
+    @staticmethod
+    def batch_update(models, interpolation, k_new, dir_old, values_diff):
+        """
+        Update several quadratic models after a change of the same
+        interpolation point.
+
+        The interpolation set must have been updated before calling this
+        method.
+
+        Parameters
+        ----------
+        models : `numpy.ndarray`, shape (m,)
+            Quadratic models to update.
+        interpolation : `cobyqa.models.Interpolation`
+            Updated interpolation set.
+        k_new : int
+            Index of the updated interpolation point.
+        dir_old : `numpy.ndarray`, shape (n,)
+            Value of ``interpolation.xpt[:, k_new]`` before the update.
+        values_diff : `numpy.ndarray`, shape (npt, m)
+            Differences between the values of the interpolated nonlinear
+            functions and the previous quadratic models at the updated
+            interpolation points.
+
+        Returns
+        -------
+        bool
+            Whether the interpolation system is ill-conditioned.
+
+        Raises
+        ------
+        `numpy.linalg.LinAlgError`
+            If the interpolation system is ill-defined.
+        """
+        if len(models) == 0:
+            return False
+
+        # Forward the k_new-th element of the implicit Hessian matrices to the
+        # explicit Hessian matrices. This must be done because the implicit
+        # Hessian matrices are related to the interpolation points, and the
+        # k_new-th interpolation point is modified.
+        dir_outer = np.outer(dir_old, dir_old)
+        for model in models:
+            model._e_hess += model._i_hess[k_new] * dir_outer
+            model._i_hess[k_new] = 0.0
+
+        # Update the quadratic models.
+        const, grad, i_hess, ill_conditioned = Quadratic._get_models(
+            interpolation,
+            values_diff,
+        )
+        for i, model in enumerate(models):
+            model._const += const[i]
+            model._grad += grad[i]
+            model._i_hess += i_hess[i]
+        return ill_conditioned
+
+    @staticmethod
+    def batch_shift_x_base(models, interpolation, new_x_base):
+        """
+        Shift the point around which several quadratic models are defined.
+
+        Parameters
+        ----------
+        models : `numpy.ndarray`, shape (m,)
+            Quadratic models to update.
+        interpolation : `cobyqa.models.Interpolation`
+            Previous interpolation set.
+        new_x_base : `numpy.ndarray`, shape (n,)
+            Point that will replace ``interpolation.x_base``.
+        """
+        # The models are evaluated one by one, but the shifted interpolation
+        # points are computed only once.
+        shift = new_x_base - interpolation.x_base
+        shift_xpt = interpolation.xpt - 0.5 * shift[:, np.newaxis]
+        for model in models:
+            model._const = model(new_x_base, interpolation)
+            model._grad = model.grad(new_x_base, interpolation)
+            update = np.outer(shift, shift_xpt @ model._i_hess)
+            model._e_hess += update + update.T
 
     @staticmethod
     def solve_systems(interpolation, rhs):
@@ -567,56 +907,167 @@ class Quadratic:
         eig_vectors = eig_vectors[:, large_eig_values]
         inv_eig_values = 1.0 / eig_values[large_eig_values]
         ill_conditioned = ~np.all(large_eig_values, 0)
-        left_scaled_solutions = eig_vectors @ (
-            (eig_vectors.T @ rhs_scaled) * inv_eig_values[:, np.newaxis]
-        )
+
+        # The systems are solved separately, so that each solution is rounded
+        # as if its system were solved alone.
+        rhs_scaled = np.ascontiguousarray(rhs_scaled.T)[:, :, np.newaxis]
+        left_scaled_solutions = np.matmul(
+            eig_vectors,
+            np.matmul(eig_vectors.T, rhs_scaled)
+            * inv_eig_values[:, np.newaxis],
+        )[:, :, 0].T
         return (
             left_scaled_solutions * right_scaling[:, np.newaxis],
             ill_conditioned,
         )
 
     @staticmethod
-    def _get_model(interpolation, values):
+    def _batch_dot(a, v):
         """
-        Solve the interpolation system.
+        Evaluate the products of the rows of a matrix with a vector.
+
+        Each product is evaluated as a separate inner product, so that the
+        result is rounded as the product of the corresponding row with `v`.
 
         Parameters
         ----------
+        a : `numpy.ndarray`, shape (m, n)
+            Matrix whose rows are multiplied with `v`.
+        v : `numpy.ndarray`, shape (n,)
+            Vector with which the rows of `a` are multiplied.
+
+        Returns
+        -------
+        `numpy.ndarray`, shape (m,)
+            Products of the rows of `a` with `v`.
+        """
+        return np.matmul(a[:, np.newaxis, :], v)[:, 0]
+
+    @staticmethod
+    def _batch_hess_prod(i_hess, e_hess, v, interpolation):
+        """
+        Evaluate the right products of stacked Hessian matrices with a vector.
+
+        Parameters
+        ----------
+        i_hess : `numpy.ndarray`, shape (m, npt)
+            Implicit Hessian matrices of the quadratic models.
+        e_hess : `numpy.ndarray`, shape (m, n, n)
+            Explicit Hessian matrices of the quadratic models.
+        v : `numpy.ndarray`, shape (n,)
+            Vector with which the Hessian matrices are multiplied from the
+            right.
         interpolation : `cobyqa.models.Interpolation`
             Interpolation set.
-        values : `numpy.ndarray`, shape (npt,)
-            Values of the interpolated function at the interpolation points.
 
         Returns
         -------
-        float
+        `numpy.ndarray`, shape (m, n)
+            Right products of the Hessian matrices with `v`.
+        """
+        # The products are evaluated separately for each model, so that they
+        # are rounded as those of `Quadratic.hess_prod`.
+        v_xpt = interpolation.xpt.T.dot(v)
+        return np.matmul(e_hess, v) + np.matmul(
+            interpolation.xpt,
+            (i_hess * v_xpt)[:, :, np.newaxis],
+        )[:, :, 0]
+
+    def _initialize(self, const, grad, i_hess, debug):
+        """
+        Initialize the quadratic model from its coefficients.
+
+        The explicit Hessian matrix of the quadratic model is set to zero.
+
+        Parameters
+        ----------
+        const : float
             Constant term of the quadratic model.
-        `numpy.ndarray`, shape (n,)
+        grad : `numpy.ndarray`, shape (n,)
             Gradient of the quadratic model at ``interpolation.x_base``.
-        `numpy.ndarray`, shape (npt,)
+        i_hess : `numpy.ndarray`, shape (npt,)
             Implicit Hessian matrix of the quadratic model.
+        debug : bool
+            Whether to make debugging tests during the execution.
+        """
+        self._debug = debug
+        self._const = const
+        self._grad = grad
+        self._i_hess = i_hess
+        self._e_hess = np.zeros((grad.size, grad.size))
+
+    @staticmethod
+    def _build(interpolation, values):
+        """
+        Build the coefficients of new quadratic models.
+
+        Parameters
+        ----------
+        interpolation : `cobyqa.models.Interpolation`
+            Interpolation set.
+        values : `numpy.ndarray`, shape (npt, m)
+            Values of the interpolated functions at the interpolation points.
+
+        Returns
+        -------
+        `numpy.ndarray`, shape (m,)
+            Constant terms of the quadratic models.
+        `numpy.ndarray`, shape (m, n)
+            Gradients of the quadratic models at ``interpolation.x_base``.
+        `numpy.ndarray`, shape (m, npt)
+            Implicit Hessian matrices of the quadratic models.
+
+        Raises
+        ------
+        ValueError
+            If there are not enough interpolation points.
+        `numpy.linalg.LinAlgError`
+            If the interpolation system is ill-defined.
+        """
+        if interpolation.npt < interpolation.n + 1:
+            raise ValueError(
+                f"The number of interpolation points must be at least "
+                f"{interpolation.n + 1}."
+            )
+        const, grad, i_hess, _ = Quadratic._get_models(interpolation, values)
+        return const, grad, i_hess
+
+    @staticmethod
+    def _get_models(interpolation, values):
+        """
+        Solve the interpolation systems of several functions at once.
+
+        Parameters
+        ----------
+        interpolation : `cobyqa.models.Interpolation`
+            Interpolation set.
+        values : `numpy.ndarray`, shape (npt, m)
+            Values of the interpolated functions at the interpolation points.
+
+        Returns
+        -------
+        `numpy.ndarray`, shape (m,)
+            Constant terms of the quadratic models.
+        `numpy.ndarray`, shape (m, n)
+            Gradients of the quadratic models at ``interpolation.x_base``.
+        `numpy.ndarray`, shape (m, npt)
+            Implicit Hessian matrices of the quadratic models.
+        bool
+            Whether the interpolation system is ill-conditioned.
 
         Raises
         ------
         `numpy.linalg.LinAlgError`
             If the interpolation system is ill-defined.
         """
-        assert values.shape == (
-            interpolation.npt,
-        ), "The shape of `values` is not valid."
         n, npt = interpolation.xpt.shape
-        x, ill_conditioned = Quadratic.solve_systems(
-            interpolation,
-            np.block(
-                [
-                    [
-                        values,
-                        np.zeros(n + 1),
-                    ]
-                ]
-            ).T,
-        )
-        return x[npt, 0], x[npt + 1:, 0], x[:npt, 0], ill_conditioned
+        rhs = np.zeros((npt + n + 1, values.shape[1]))
+        rhs[:npt, :] = values
+        x, ill_conditioned = Quadratic.solve_systems(interpolation, rhs)
+
+        # Store the coefficients of each model contiguously.
+        x = np.ascontiguousarray(x.T)
+        return x[:, npt], x[:, npt + 1:], x[:, :npt], ill_conditioned
 
 
 class Models:
@@ -652,7 +1103,9 @@ class Models:
         self._interpolation = Interpolation(pb, options)
 
         # Evaluate the nonlinear functions at the initial interpolation points.
-        x_eval = self.interpolation.point(0)
+        # The points are all computed at once, each row being a point.
+        x_init = self.interpolation.x_base + self.interpolation.xpt.T
+        x_eval = x_init[0]
         fun_init, cub_init, ceq_init = pb(x_eval)
         self._fun_val = np.full(options[Options.NPT], np.nan)
         self._cub_val = np.full((options[Options.NPT], cub_init.size), np.nan)
@@ -665,7 +1118,7 @@ class Models:
                 self.cub_val[k, :] = cub_init
                 self.ceq_val[k, :] = ceq_init
             else:
-                x_eval = self.interpolation.point(k)
+                x_eval = x_init[k]
                 self.fun_val[k], self.cub_val[k, :], self.ceq_val[k, :] = pb(
                     x_eval
                 )
@@ -675,7 +1128,7 @@ class Models:
             if (
                 pb.is_feasibility
                 and pb.maxcv(
-                    self.interpolation.point(k),
+                    x_eval,
                     self.cub_val[k, :],
                     self.ceq_val[k, :],
                 )
@@ -688,7 +1141,7 @@ class Models:
             if (
                 self._fun_val[k] <= options[Options.TARGET]
                 and pb.maxcv(
-                    self.interpolation.point(k),
+                    x_eval,
                     self.cub_val[k, :],
                     self.ceq_val[k, :],
                 )
@@ -697,27 +1150,7 @@ class Models:
                 raise TargetSuccess
 
         # Build the initial quadratic models.
-        self._fun = Quadratic(
-            self.interpolation,
-            self._fun_val,
-            options[Options.DEBUG],
-        )
-        self._cub = np.empty(self.m_nonlinear_ub, dtype=Quadratic)
-        self._ceq = np.empty(self.m_nonlinear_eq, dtype=Quadratic)
-        for i in range(self.m_nonlinear_ub):
-            self._cub[i] = Quadratic(
-                self.interpolation,
-                self.cub_val[:, i],
-                options[Options.DEBUG],
-            )
-        for i in range(self.m_nonlinear_eq):
-            self._ceq[i] = Quadratic(
-                self.interpolation,
-                self.ceq_val[:, i],
-                options[Options.DEBUG],
-            )
-        if self._debug:
-            self._check_interpolation_conditions()
+        self._build_models()
 
     @property
     def n(self):
@@ -964,8 +1397,10 @@ class Models:
             assert mask is None or mask.shape == (
                 self.m_nonlinear_ub,
             ), "The shape of `mask` is not valid."
-        return np.array(
-            [model(x, self.interpolation) for model in self._get_cub(mask)]
+        return Quadratic.batch_call(
+            self._get_cub_stack(mask),
+            x,
+            self.interpolation,
         )
 
     def cub_grad(self, x, mask=None):
@@ -992,10 +1427,10 @@ class Models:
             assert mask is None or mask.shape == (
                 self.m_nonlinear_ub,
             ), "The shape of `mask` is not valid."
-        return np.reshape(
-            [model.grad(x, self.interpolation)
-             for model in self._get_cub(mask)],
-            (-1, self.n),
+        return Quadratic.batch_grad(
+            self._get_cub_stack(mask),
+            x,
+            self.interpolation,
         )
 
     def cub_hess(self, mask=None):
@@ -1018,9 +1453,9 @@ class Models:
             assert mask is None or mask.shape == (
                 self.m_nonlinear_ub,
             ), "The shape of `mask` is not valid."
-        return np.reshape(
-            [model.hess(self.interpolation) for model in self._get_cub(mask)],
-            (-1, self.n, self.n),
+        return Quadratic.batch_hess(
+            self._get_cub_stack(mask),
+            self.interpolation,
         )
 
     def cub_hess_prod(self, v, mask=None):
@@ -1047,12 +1482,10 @@ class Models:
             assert mask is None or mask.shape == (
                 self.m_nonlinear_ub,
             ), "The shape of `mask` is not valid."
-        return np.reshape(
-            [
-                model.hess_prod(v, self.interpolation)
-                for model in self._get_cub(mask)
-            ],
-            (-1, self.n),
+        return Quadratic.batch_hess_prod(
+            self._get_cub_stack(mask),
+            v,
+            self.interpolation,
         )
 
     def cub_curv(self, v, mask=None):
@@ -1079,9 +1512,10 @@ class Models:
             assert mask is None or mask.shape == (
                 self.m_nonlinear_ub,
             ), "The shape of `mask` is not valid."
-        return np.array(
-            [model.curv(v, self.interpolation)
-             for model in self._get_cub(mask)]
+        return Quadratic.batch_curv(
+            self._get_cub_stack(mask),
+            v,
+            self.interpolation,
         )
 
     def ceq(self, x, mask=None):
@@ -1107,8 +1541,10 @@ class Models:
             assert mask is None or mask.shape == (
                 self.m_nonlinear_eq,
             ), "The shape of `mask` is not valid."
-        return np.array(
-            [model(x, self.interpolation) for model in self._get_ceq(mask)]
+        return Quadratic.batch_call(
+            self._get_ceq_stack(mask),
+            x,
+            self.interpolation,
         )
 
     def ceq_grad(self, x, mask=None):
@@ -1135,10 +1571,10 @@ class Models:
             assert mask is None or mask.shape == (
                 self.m_nonlinear_eq,
             ), "The shape of `mask` is not valid."
-        return np.reshape(
-            [model.grad(x, self.interpolation)
-             for model in self._get_ceq(mask)],
-            (-1, self.n),
+        return Quadratic.batch_grad(
+            self._get_ceq_stack(mask),
+            x,
+            self.interpolation,
         )
 
     def ceq_hess(self, mask=None):
@@ -1161,9 +1597,9 @@ class Models:
             assert mask is None or mask.shape == (
                 self.m_nonlinear_eq,
             ), "The shape of `mask` is not valid."
-        return np.reshape(
-            [model.hess(self.interpolation) for model in self._get_ceq(mask)],
-            (-1, self.n, self.n),
+        return Quadratic.batch_hess(
+            self._get_ceq_stack(mask),
+            self.interpolation,
         )
 
     def ceq_hess_prod(self, v, mask=None):
@@ -1190,12 +1626,10 @@ class Models:
             assert mask is None or mask.shape == (
                 self.m_nonlinear_eq,
             ), "The shape of `mask` is not valid."
-        return np.reshape(
-            [
-                model.hess_prod(v, self.interpolation)
-                for model in self._get_ceq(mask)
-            ],
-            (-1, self.n),
+        return Quadratic.batch_hess_prod(
+            self._get_ceq_stack(mask),
+            v,
+            self.interpolation,
         )
 
     def ceq_curv(self, v, mask=None):
@@ -1222,9 +1656,10 @@ class Models:
             assert mask is None or mask.shape == (
                 self.m_nonlinear_eq,
             ), "The shape of `mask` is not valid."
-        return np.array(
-            [model.curv(v, self.interpolation)
-             for model in self._get_ceq(mask)]
+        return Quadratic.batch_curv(
+            self._get_ceq_stack(mask),
+            v,
+            self.interpolation,
         )
 
     def reset_models(self):
@@ -1238,21 +1673,7 @@ class Models:
         `numpy.linalg.LinAlgError`
             If the interpolation system is ill-defined.
         """
-        self._fun = Quadratic(self.interpolation, self.fun_val, self._debug)
-        for i in range(self.m_nonlinear_ub):
-            self._cub[i] = Quadratic(
-                self.interpolation,
-                self.cub_val[:, i],
-                self._debug,
-            )
-        for i in range(self.m_nonlinear_eq):
-            self._ceq[i] = Quadratic(
-                self.interpolation,
-                self.ceq_val[:, i],
-                self._debug,
-            )
-        if self._debug:
-            self._check_interpolation_conditions()
+        self._build_models()
 
     def update_interpolation(self, k_new, x_new, fun_val, cub_val, ceq_val):
         """
@@ -1312,27 +1733,26 @@ class Models:
         dir_old = np.copy(self.interpolation.xpt[:, k_new])
         self.interpolation.xpt[:, k_new] = x_new - self.interpolation.x_base
 
-        # Update the quadratic models.
+        # Update the quadratic models. The models of the nonlinear constraints
+        # are left unchanged if the interpolation system is ill-conditioned.
+        # Otherwise, they all share the same interpolation system, which is
+        # hence solved only once for all of them.
         ill_conditioned = self._fun.update(
             self.interpolation,
             k_new,
             dir_old,
             fun_diff,
         )
-        for i in range(self.m_nonlinear_ub):
-            ill_conditioned = ill_conditioned or self._cub[i].update(
+        if not ill_conditioned:
+            Quadratic.batch_update(
+                np.concatenate((self._cub, self._ceq)),
                 self.interpolation,
                 k_new,
                 dir_old,
-                cub_diff[:, i],
-            )
-        for i in range(self.m_nonlinear_eq):
-            ill_conditioned = ill_conditioned or self._ceq[i].update(
-                self.interpolation,
-                k_new,
-                dir_old,
-                ceq_diff[:, i],
+                np.c_[cub_diff, ceq_diff],
             )
+        self._cub_stack = None
+        self._ceq_stack = None
         if self._debug:
             self._check_interpolation_conditions()
         return ill_conditioned
@@ -1380,36 +1800,32 @@ class Models:
                 k_new is None or 0 <= k_new < self.npt
             ), "The index `k_new` is not valid."
 
-        # Compute the values independent of k_new.
+        # Build the right-hand sides. The first one is independent of k_new,
+        # and the others are coordinate vectors. All the systems are solved
+        # together, as they share the same matrix.
+        npt = self.npt
         shift = x_new - self.interpolation.x_base
-        new_col = np.empty((self.npt + self.n + 1, 1))
-        new_col[: self.npt, 0] = (
-                0.5 * (self.interpolation.xpt.T @ shift) ** 2.0)
-        new_col[self.npt, 0] = 1.0
-        new_col[self.npt + 1:, 0] = shift
-        inv_new_col = Quadratic.solve_systems(self.interpolation, new_col)[0]
-        beta = 0.5 * (shift @ shift) ** 2.0 - new_col[:, 0] @ inv_new_col[:, 0]
+        if k_new is None:
+            rhs = np.eye(npt + self.n + 1, npt + 1, 1)
+        else:
+            rhs = np.zeros((npt + self.n + 1, 2))
+            rhs[k_new, 1] = 1.0
+        shift_xpt = self.interpolation.xpt.T.dot(shift)
+        rhs[:npt, 0] = 0.5 * shift_xpt * shift_xpt
+        rhs[npt, 0] = 1.0
+        rhs[npt + 1:, 0] = shift
+        sol = Quadratic.solve_systems(self.interpolation, rhs)[0]
+        shift_sq = shift.dot(shift)
+        beta = 0.5 * shift_sq * shift_sq - rhs[:, 0].dot(sol[:, 0])
 
         # Compute the values that depend on k.
         if k_new is None:
-            coord_vec = np.eye(self.npt + self.n + 1, self.npt)
-            alpha = np.diag(
-                Quadratic.solve_systems(
-                    self.interpolation,
-                    coord_vec,
-                )[0]
-            )
-            tau = inv_new_col[: self.npt, 0]
+            alpha = np.diag(sol[:npt, 1:])
+            tau = sol[:npt, 0]
         else:
-            coord_vec = np.eye(self.npt + self.n + 1, 1, -k_new)
-            alpha = Quadratic.solve_systems(
-                self.interpolation,
-                coord_vec,
-            )[
-                0
-            ][k_new, 0]
-            tau = inv_new_col[k_new, 0]
-        return alpha * beta + tau**2.0
+            alpha = sol[k_new, 1]
+            tau = sol[k_new, 0]
+        return alpha * beta + tau * tau
 
     def shift_x_base(self, new_x_base, options):
         """
@@ -1428,11 +1844,13 @@ class Models:
             ), "The shape of `new_x_base` is not valid."
 
         # Update the models.
-        self._fun.shift_x_base(self.interpolation, new_x_base)
-        for model in self._cub:
-            model.shift_x_base(self.interpolation, new_x_base)
-        for model in self._ceq:
-            model.shift_x_base(self.interpolation, new_x_base)
+        Quadratic.batch_shift_x_base(
+            np.concatenate(([self._fun], self._cub, self._ceq)),
+            self.interpolation,
+            new_x_base,
+        )
+        self._cub_stack = None
+        self._ceq_stack = None
 
         # Update the base point and the interpolation points.
         shift = new_x_base - self.interpolation.x_base
@@ -1441,66 +1859,101 @@ class Models:
         if options[Options.DEBUG]:
             self._check_interpolation_conditions()
 
-    def _get_cub(self, mask=None):
+    def _build_models(self):
+        """
+        Build the quadratic models of the objective function, nonlinear
+        inequality constraints, and nonlinear equality constraints.
+
+        Raises
+        ------
+        `numpy.linalg.LinAlgError`
+            If the interpolation system is ill-defined.
+        """
+        models = Quadratic.batch_new(
+            self.interpolation,
+            np.c_[self.fun_val, self.cub_val, self.ceq_val],
+            self._debug,
+        )
+        self._fun = models[0]
+        self._cub = models[1:self.m_nonlinear_ub + 1]
+        self._ceq = models[self.m_nonlinear_ub + 1:]
+        self._cub_stack = None
+        self._ceq_stack = None
+        if self._debug:
+            self._check_interpolation_conditions()
+
+    def _get_cub_stack(self, mask=None):
         """
-        Get the quadratic models of the nonlinear inequality constraints.
+        Get the stacked coefficients of the quadratic models of the nonlinear
+        inequality constraints.
+
+        The coefficients are stacked only once after each modification of the
+        models.
 
         Parameters
         ----------
         mask : `numpy.ndarray`, shape (m_nonlinear_ub,), optional
-            Mask of the quadratic models to return.
+            Mask of the quadratic models to consider.
 
         Returns
         -------
-        `numpy.ndarray`
-            Quadratic models of the nonlinear inequality constraints.
+        tuple
+            Stacked coefficients of the quadratic models, as returned by
+            `Quadratic.stack`.
         """
-        return self._cub if mask is None else self._cub[mask]
+        if self._cub_stack is None:
+            self._cub_stack = Quadratic.stack(self._cub)
+        if mask is None or self._cub.size == 0 or mask.all():
+            return self._cub_stack
+        return tuple(coefficients[mask] for coefficients in self._cub_stack)
 
-    def _get_ceq(self, mask=None):
+    def _get_ceq_stack(self, mask=None):
         """
-        Get the quadratic models of the nonlinear equality constraints.
+        Get the stacked coefficients of the quadratic models of the nonlinear
+        equality constraints.
+
+        The coefficients are stacked only once after each modification of the
+        models.
 
         Parameters
         ----------
         mask : `numpy.ndarray`, shape (m_nonlinear_eq,), optional
-            Mask of the quadratic models to return.
+            Mask of the quadratic models to consider.
 
         Returns
         -------
-        `numpy.ndarray`
-            Quadratic models of the nonlinear equality constraints.
+        tuple
+            Stacked coefficients of the quadratic models, as returned by
+            `Quadratic.stack`.
         """
-        return self._ceq if mask is None else self._ceq[mask]
+        if self._ceq_stack is None:
+            self._ceq_stack = Quadratic.stack(self._ceq)
+        if mask is None or self._ceq.size == 0 or mask.all():
+            return self._ceq_stack
+        return tuple(coefficients[mask] for coefficients in self._ceq_stack)
 
     def _check_interpolation_conditions(self):
         """
         Check the interpolation conditions of all quadratic models.
         """
-        error_fun = 0.0
-        error_cub = 0.0
-        error_ceq = 0.0
-        for k in range(self.npt):
-            error_fun = np.max(
-                [
-                    error_fun,
-                    np.abs(
-                        self.fun(self.interpolation.point(k)) - self.fun_val[k]
-                    ),
-                ]
-            )
-            error_cub = np.max(
-                np.abs(
-                    self.cub(self.interpolation.point(k)) - self.cub_val[k, :]
-                ),
-                initial=error_cub,
-            )
-            error_ceq = np.max(
-                np.abs(
-                    self.ceq(self.interpolation.point(k)) - self.ceq_val[k, :]
-                ),
-                initial=error_ceq,
-            )
+        # Evaluate all the models at all the interpolation points at once.
+        # The interpolation points are taken relative to the base point, as
+        # they are stored.
+        fun_xpt = Quadratic.batch_call_xpt(
+            Quadratic.stack([self._fun]),
+            self.interpolation,
+        )
+        cub_xpt = Quadratic.batch_call_xpt(
+            self._get_cub_stack(),
+            self.interpolation,
+        )
+        ceq_xpt = Quadratic.batch_call_xpt(
+            self._get_ceq_stack(),
+            self.interpolation,
+        )
+        error_fun = np.max(np.abs(fun_xpt[0] - self.fun_val), initial=0.0)
+        error_cub = np.max(np.abs(cub_xpt.T - self.cub_val), initial=0.0)
+        error_ceq = np.max(np.abs(ceq_xpt.T - self.ceq_val), initial=0.0)
         tol = 10.0 * np.sqrt(EPS) * max(self.n, self.npt)
         if error_fun > tol * np.max(np.abs(self.fun_val), initial=1.0):
             warnings.warn(
@@ -22,7 +22,7 @@ class ObjectiveFunction:
     Real-valued objective function.
     """
 
-    def __init__(self, fun, verbose, debug, *args):
+    def __init__(self, fun, verbose, debug, args=()):
         """
         Initialize the objective function.
 
@@ -38,13 +38,14 @@ class ObjectiveFunction:
             Whether to print the function evaluations.
         debug : bool
             Whether to make debugging tests during the execution.
-        *args : tuple
+        args : tuple, optional
             Additional arguments to be passed to the function.
         """
         if debug:
             assert fun is None or callable(fun)
             assert isinstance(verbose, bool)
             assert isinstance(debug, bool)
+            assert isinstance(args, tuple)
 
         self._fun = fun
         self._verbose = verbose
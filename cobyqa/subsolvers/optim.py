@@ -1124,12 +1124,12 @@ def qr_tangential_byrd_omojokun(aub, aeq, free_xl, free_xu, free_ub):
     n = free_xl.size
     identity = np.eye(n)
     q, r, _ = qr(
-        np.block(
+        np.vstack(
             [
-                [aeq],
-                [aub[~free_ub, :]],
-                [-identity[~free_xl, :]],
-                [identity[~free_xu, :]],
+                aeq,
+                aub[~free_ub, :],
+                -identity[~free_xl, :],
+                identity[~free_xu, :],
             ]
         ).T,
         pivoting=True,
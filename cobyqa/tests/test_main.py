@@ -1,9 +1,13 @@
+import _thread
+import threading
+import time
+
 import numpy as np
 import pytest
 from scipy.optimize import Bounds, LinearConstraint, NonlinearConstraint
 from scipy.optimize._minimize import standardize_constraints
 
-from ..main import minimize
+from ..main import minimize, minimize_batch
 
 
 class TestMinimize:
@@ -312,3 +316,129 @@ class TestMinimize:
                 self.x0,
                 options={"unknown": 0},
             )
+
+
+class TestMinimizeBatch:
+
+    def setup_method(self):
+        self.x0_batch = [[4.0, 1.0], [-2.0, 3.0], [1.0, -1.0]]
+        self.options = {"debug": True}
+
+    # The powers are written as products, so that the scalar and vectorized
+    # functions round identically.
+    @staticmethod
+    def fun(x, c=1.0):
+        return x[0] * x[0] + c * abs(x[1]) * x[1] * x[1]
+
+    @staticmethod
+    def fun_vectorized(x, c=1.0):
+        x = np.asarray(x)
+        assert x.ndim == 2 and x.shape[1] == 2
+        return x[:, 0] * x[:, 0] + c * np.abs(x[:, 1]) * x[:, 1] * x[:, 1]
+
+    @staticmethod
+    def con(x):
+        return x[0] ** 2 + x[1] ** 2 - 25.0
+
+    @pytest.mark.parametrize("vectorized", [False, True])
+    def test_simple(self, vectorized):
+        batch_sizes = []
+
+        def fun_vectorized(x, c):
+            batch_sizes.append(len(x))
+            return self.fun_vectorized(x, c)
+
+        fun = fun_vectorized if vectorized else self.fun
+        constraints = NonlinearConstraint(self.con, 0.0, 0.0)
+        res = minimize_batch(
+            fun,
+            self.x0_batch,
+            (2.0,),
+            constraints=constraints,
+            options=self.options,
+            vectorized=vectorized,
+        )
+        assert len(res) == len(self.x0_batch)
+        for x0, res_batch in zip(self.x0_batch, res):
+            res_single = minimize(
+                self.fun,
+                x0,
+                (2.0,),
+                constraints=constraints,
+                options=self.options,
+            )
+            np.testing.assert_array_equal(res_batch.x, res_single.x)
+            assert res_batch.fun == res_single.fun
+            assert res_batch.nfev == res_single.nfev
+            assert res_batch.status == res_single.status
+        if vectorized:
+            # All the runs request the initial guesses at once.
+            assert batch_sizes[0] == len(self.x0_batch)
+            assert sum(batch_sizes) == sum(r.nfev for r in res)
+
+    @pytest.mark.parametrize("vectorized", [False, True])
+    def test_scalar_args(self, vectorized):
+        fun = self.fun_vectorized if vectorized else self.fun
+        res = minimize_batch(
+            fun,
+            self.x0_batch,
+            2.0,
+            options=self.options,
+            vectorized=vectorized,
+        )
+        for x0, res_batch in zip(self.x0_batch, res):
+            res_single = minimize(self.fun, x0, 2.0, options=self.options)
+            np.testing.assert_array_equal(res_batch.x, res_single.x)
+            assert res_batch.nfev == res_single.nfev
+
+    def test_callback(self):
+        # The callback is called by one run at a time, and keeps its
+        # signature.
+        n_calls = []
+        n_running = []
+
+        def callback(intermediate_result):
+            assert not n_running
+            n_running.append(True)
+            time.sleep(1e-4)
+            n_calls.append(intermediate_result.fun)
+            n_running.pop()
+
+        res = minimize_batch(
+            self.fun_vectorized,
+            self.x0_batch,
+            callback=callback,
+            vectorized=True,
+        )
+        assert len(n_calls) == sum(r.nfev for r in res)
+
+    def test_exceptions(self):
+        with pytest.raises(ValueError):
+            minimize_batch(self.fun_vectorized, [4.0, 1.0], vectorized=True)
+
+        def fun(x):
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            minimize_batch(fun, self.x0_batch, vectorized=True)
+
+    def test_interrupt(self):
+        # An interruption of the main thread while it waits for the runs must
+        # reach the caller, and the threads of the runs must terminate.
+        n_threads = threading.active_count()
+
+        def callback(x):
+            if not interrupted:
+                interrupted.append(True)
+                _thread.interrupt_main()
+                time.sleep(0.1)
+
+        interrupted = []
+        with pytest.raises(KeyboardInterrupt):
+            minimize_batch(
+                self.fun_vectorized,
+                self.x0_batch,
+                callback=callback,
+                vectorized=True,
+            )
+        assert threading.active_count() == n_threads
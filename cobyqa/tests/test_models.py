@@ -129,6 +129,72 @@ class TestQuadratic:
                 atol=1e-13,
             )
 
+    def test_batch(self):
+        problem = get_problem([0.5, 0.5])
+        options = {
+            Options.RHOBEG.value: 0.5,
+            Options.RHOEND.value: 1e-6,
+            Options.NPT.value: 2 * problem.n + 1,
+            Options.DEBUG.value: True,
+        }
+        interpolation = Interpolation(problem, options)
+        values = np.reshape(np.arange(3 * interpolation.npt), (-1, 3))
+        models = Quadratic.batch_new(interpolation, values, True)
+        assert models.shape == (3,)
+        x = np.array([0.2, -0.3])
+        for i, model in enumerate(models):
+            other = Quadratic(interpolation, values[:, i], True)
+            np.testing.assert_allclose(
+                model(x, interpolation),
+                other(x, interpolation),
+                atol=1e-13,
+            )
+
+        # Replace an interpolation point and update all the models.
+        new_values = values.astype(float)
+        new_values[0, :] = [1.0, 2.0, 3.0]
+        values_diff = np.zeros(values.shape)
+        values_diff[0, :] = new_values[0, :] - Quadratic.batch_call(
+            Quadratic.stack(models),
+            x,
+            interpolation,
+        )
+        dir_old = np.copy(interpolation.xpt[:, 0])
+        interpolation.xpt[:, 0] = x - interpolation.x_base
+        Quadratic.batch_update(
+            models,
+            interpolation,
+            0,
+            dir_old,
+            values_diff,
+        )
+        for i, model in enumerate(models):
+            for k in range(interpolation.npt):
+                np.testing.assert_allclose(
+                    model(interpolation.point(k), interpolation),
+                    new_values[k, i],
+                    atol=1e-12,
+                )
+
+        # The batched evaluations are rounded as the individual ones.
+        coefficients = Quadratic.stack(models)
+        np.testing.assert_array_equal(
+            Quadratic.batch_call(coefficients, x, interpolation),
+            [model(x, interpolation) for model in models],
+        )
+        np.testing.assert_array_equal(
+            Quadratic.batch_grad(coefficients, x, interpolation),
+            [model.grad(x, interpolation) for model in models],
+        )
+        np.testing.assert_array_equal(
+            Quadratic.batch_hess_prod(coefficients, x, interpolation),
+            [model.hess_prod(x, interpolation) for model in models],
+        )
+        np.testing.assert_array_equal(
+            Quadratic.batch_curv(coefficients, x, interpolation),
+            [model.curv(x, interpolation) for model in models],
+        )
+
     def test_exceptions(self):
         problem = get_problem([0.5, 0.5])
         options = {
@@ -162,6 +228,34 @@ class TestModels:
         assert models.m_nonlinear_ub == problem.m_nonlinear_ub
         assert models.m_nonlinear_eq == problem.m_nonlinear_eq
 
+    def test_determinants(self):
+        problem = get_problem([0.5, 0.5])
+        options = {
+            Options.RHOBEG.value: 0.5,
+            Options.RHOEND.value: 1e-6,
+            Options.NPT.value: 2 * problem.n + 1,
+            Options.MAX_EVAL.value: 1000,
+            Options.FEASIBILITY_TOL.value: 1e-8,
+            Options.TARGET.value: 0.0,
+            Options.DEBUG.value: True,
+        }
+        models = Models(problem, options)
+        x_new = np.array([0.2, 0.7])
+        det = models.determinants(x_new)
+        for k in range(models.npt):
+            np.testing.assert_allclose(
+                models.determinants(x_new, k),
+                det[k],
+                atol=1e-13,
+            )
+
+            # Replacing a point by itself leaves the system unchanged.
+            np.testing.assert_allclose(
+                models.determinants(models.interpolation.point(k))[k],
+                1.0,
+                atol=1e-12,
+            )
+
     def test_max_eval(self):
         problem = get_problem([0.5, 0.5])
         options = {
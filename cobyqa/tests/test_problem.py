@@ -41,7 +41,7 @@ class TestObjectiveFunction(BaseTest):
         assert captured.out == ""
 
     def test_args(self):
-        obj = ObjectiveFunction(self.rosen, False, True, 2.0)
+        obj = ObjectiveFunction(self.rosen, False, True, (2.0,))
         x = [1.5, 1.5]
         assert obj(x) == self.rosen(x, 2.0)
 
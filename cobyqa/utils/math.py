@@ -27,7 +27,7 @@ def get_arrays_tol(*arrays):
         raise ValueError("At least one array must be provided.")
     size = max(array.size for array in arrays)
     weight = max(
-        np.max(np.abs(array[np.isfinite(array)]), initial=1.0)
+        np.abs(array).max(initial=1.0, where=np.isfinite(array))
         for array in arrays
     )
     return 10.0 * EPS * max(size, 1.0) * weight
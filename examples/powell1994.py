@@ -256,23 +256,27 @@ def _solution(no):
 
 
 def _resid(x, no):
+    # Gather the values and bounds of all the constraints, so that the
+    # violation is obtained with two reductions.
+    values = [np.empty(0)]
+    lb = [np.empty(0)]
+    ub = [np.empty(0)]
     bounds = _bounds(no)
     if bounds is not None:
-        resid = np.max(bounds.lb - x, initial=0.0)
-        resid = np.max(x - bounds.ub, initial=resid)
-    else:
-        resid = 0.0
-    constraints = _constraints(no)
-    for constraint in constraints:
+        values.append(x)
+        lb.append(np.broadcast_to(bounds.lb, x.shape))
+        ub.append(np.broadcast_to(bounds.ub, x.shape))
+    for constraint in _constraints(no):
         if isinstance(constraint, LinearConstraint):
-            c = np.dot(constraint.A, x)
-            resid = np.max(np.asarray(constraint.lb) - c, initial=resid)
-            resid = np.max(c - np.asarray(constraint.ub), initial=resid)
+            c = np.atleast_1d(np.dot(constraint.A, x))
         else:
-            c = np.asarray(constraint.fun(x))
-            resid = np.max(np.asarray(constraint.lb) - c, initial=resid)
-            resid = np.max(c - np.asarray(constraint.ub), initial=resid)
-    return resid
+            c = np.atleast_1d(constraint.fun(x))
+        values.append(c)
+        lb.append(np.broadcast_to(constraint.lb, c.shape))
+        ub.append(np.broadcast_to(constraint.ub, c.shape))
+    values = np.concatenate(values)
+    resid = np.max(np.concatenate(lb) - values, initial=0.0)
+    return np.max(values - np.concatenate(ub), initial=resid)
 
 
 def _distance(x, no):